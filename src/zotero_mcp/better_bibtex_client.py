@@ -3,12 +3,16 @@ Helper for accessing Zotero via Better BibTeX JSON-RPC API.
 Provides direct access to Zotero's annotations without requiring PDF extraction.
 """
 
+import functools
 import json
 import requests
 import os
 import sys
 from typing import Dict, Any, List, Optional
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 class ZoteroBetterBibTexAPI:
     """Class to interact with Zotero's local Better BibTeX JSON-RPC API"""
 
@@ -31,6 +35,21 @@ class ZoteroBetterBibTexAPI:
             'Accept': 'application/json',
             'Connection': 'keep-alive',
         }
+        # Pooled session so repeated JSON-RPC calls reuse the TCP
+        # connection to Zotero instead of re-handshaking per request
+        self.session = requests.Session()
+        self.session.mount(
+            "http://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.2,
+                    status_forcelist=[502, 503, 504],
+                ),
+            ),
+        )
 
     def _make_request(self, method: str, params: list[Any]) -> dict[str, Any]:
         """
@@ -51,7 +70,7 @@ class ZoteroBetterBibTexAPI:
         }
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.base_url,
                 headers=self.headers,
                 data=json.dumps(payload),
@@ -75,7 +94,7 @@ class ZoteroBetterBibTexAPI:
     def is_zotero_running(self) -> bool:
         """Check if Zotero is running and accessible."""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"http://127.0.0.1:{self.port}/better-bibtex/cayw?probe=true",
                 headers=self.headers,
                 timeout=5
@@ -360,6 +379,20 @@ def format_annotation_markdown(annotation: dict[str, Any]) -> str:
 
     return "\n".join(md)
 
+# Common annotation colors
+_COLOR_MAP = {
+    "#ffd400": "Yellow",
+    "#ff6666": "Red",
+    "#5fb236": "Green",
+    "#2ea8e5": "Blue",
+    "#a28ae5": "Purple",
+    "#e56eee": "Magenta",
+    "#f19837": "Orange",
+    "#aaaaaa": "Gray"
+}
+
+
+@functools.lru_cache(maxsize=256)
 def get_color_category(hex_color: str) -> str:
     """
     Get a color category name from a hex color code.
@@ -370,16 +403,4 @@ def get_color_category(hex_color: str) -> str:
     Returns:
         A color category name
     """
-    # Simple implementation based on common annotation colors
-    color_map = {
-        "#ffd400": "Yellow",
-        "#ff6666": "Red",
-        "#5fb236": "Green",
-        "#2ea8e5": "Blue",
-        "#a28ae5": "Purple",
-        "#e56eee": "Magenta",
-        "#f19837": "Orange",
-        "#aaaaaa": "Gray"
-    }
-
-    return color_map.get(hex_color.lower(), "")
+    return _COLOR_MAP.get(hex_color.lower(), "")
@@ -3,15 +3,20 @@ Zotero client wrapper for MCP server.
 """
 
 import os
+import re
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
 from dotenv import load_dotenv
-from markitdown import MarkItDown
 from pyzotero import zotero
 
-from zotero_mcp.utils import format_creators
+from zotero_mcp.utils import format_creators, refresh_local_flag
 
 # Load environment variables
 load_dotenv()
@@ -24,76 +29,262 @@ def _is_truthy(value: str | None) -> bool:
     return value.strip().lower() in {"true", "yes", "1", "on"}
 
 
+@dataclass(frozen=True)
+class _EnvConfig:
+    """Parsed Zotero environment configuration, resolved once per process."""
+
+    library_id: str | None
+    local_library_id: str
+    library_type: str
+    api_key: str | None
+    local: bool
+    read_mode: str
+    write_mode: str
+    web_available: bool
+
+
+@lru_cache(maxsize=1)
+def _load_env_config() -> _EnvConfig:
+    """Parse Zotero environment variables once and cache the result.
+
+    MCP tools resolve client routing on every request; caching keeps that
+    hot path free of repeated `os.getenv` calls and truthy parsing.
+    """
+    library_id = os.getenv("ZOTERO_LIBRARY_ID")
+    api_key = os.getenv("ZOTERO_API_KEY")
+    return _EnvConfig(
+        library_id=library_id,
+        local_library_id=os.getenv("ZOTERO_LOCAL_LIBRARY_ID") or library_id or "0",
+        library_type=os.getenv("ZOTERO_LIBRARY_TYPE", "user"),
+        api_key=api_key,
+        local=_is_truthy(os.getenv("ZOTERO_LOCAL")),
+        read_mode=(os.getenv("ZOTERO_READ_MODE", "auto") or "auto").strip().lower(),
+        write_mode=(os.getenv("ZOTERO_WRITE_MODE", "auto") or "auto").strip().lower(),
+        web_available=bool(library_id and api_key),
+    )
+
+
+# Constructed clients keyed by (mode, library_id, library_type), cached
+# per thread: pyzotero clients carry per-call mutable state
+# (add_parameters stores url_params that the next retrieval consumes), so
+# one instance shared across FastMCP worker threads would let concurrent
+# tools swallow each other's parameters. Worker threads are pooled, so
+# per-thread reuse still keeps keep-alive sockets alive across tool calls.
+_thread_clients = threading.local()
+_client_cache_generation = 0
+
+
+def _client_cache() -> dict[tuple[str, str, str], zotero.Zotero]:
+    """Return the calling thread's client cache, reset after reload_env."""
+    if getattr(_thread_clients, "generation", None) != _client_cache_generation:
+        _thread_clients.cache = {}
+        _thread_clients.generation = _client_cache_generation
+    return _thread_clients.cache
+
+
+def reload_env() -> None:
+    """Drop cached environment config and clients (for tests or env changes)."""
+    global _client_cache_generation
+    _load_env_config.cache_clear()
+    _client_cache_generation += 1
+    refresh_local_flag()
+
+
 def _web_config_available() -> bool:
     """Return True when required Web API configuration is present."""
-    return bool(os.getenv("ZOTERO_LIBRARY_ID") and os.getenv("ZOTERO_API_KEY"))
+    return _load_env_config().web_available
+
+
+def _configure_http_pooling(client: zotero.Zotero) -> zotero.Zotero:
+    """Enlarge the client's keep-alive pool and add retries for bulk reads.
+
+    Recent pyzotero releases wrap an `httpx.Client`; older ones expose a
+    `requests.Session`. Handle both and degrade silently if neither shape
+    matches, since default pooling still works.
+    """
+    session = getattr(client, "session", None)
+    if session is not None and hasattr(session, "mount"):
+        # requests-based pyzotero
+        try:
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=64,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    respect_retry_after_header=True,
+                ),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        except Exception:
+            pass
+        return client
+
+    http_client = getattr(client, "client", None)
+    if http_client is not None:
+        # httpx-based pyzotero: rebuild the client with a bigger pool and
+        # connection retries, preserving pyzotero's headers and timeout.
+        try:
+            import httpx
+
+            client.client = httpx.Client(
+                headers=dict(http_client.headers),
+                follow_redirects=True,
+                timeout=http_client.timeout,
+                transport=httpx.HTTPTransport(
+                    retries=3,
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                ),
+            )
+        except Exception:
+            pass
+    return client
 
 
 def _create_local_client() -> zotero.Zotero:
-    """Create a client bound to the local Zotero API."""
-    library_type = os.getenv("ZOTERO_LIBRARY_TYPE", "user")
-    library_id = os.getenv("ZOTERO_LOCAL_LIBRARY_ID") or os.getenv("ZOTERO_LIBRARY_ID") or "0"
-    return zotero.Zotero(
-        library_id=library_id,
-        library_type=library_type,
-        api_key=None,
-        local=True,
-    )
+    """Create (or reuse) a client bound to the local Zotero API."""
+    cfg = _load_env_config()
+    cache = _client_cache()
+    cache_key = ("local", cfg.local_library_id, cfg.library_type)
+    client = cache.get(cache_key)
+    if client is None:
+        client = _configure_http_pooling(
+            zotero.Zotero(
+                library_id=cfg.local_library_id,
+                library_type=cfg.library_type,
+                api_key=None,
+                local=True,
+            )
+        )
+        cache[cache_key] = client
+    return client
 
 
 def _create_web_client() -> zotero.Zotero:
-    """Create a client bound to Zotero Web API."""
-    library_id = os.getenv("ZOTERO_LIBRARY_ID")
-    library_type = os.getenv("ZOTERO_LIBRARY_TYPE", "user")
-    api_key = os.getenv("ZOTERO_API_KEY")
+    """Create (or reuse) a client bound to Zotero Web API."""
+    cfg = _load_env_config()
 
-    if not (library_id and api_key):
+    if not cfg.web_available:
         raise ValueError(
             "Missing required web configuration. Set ZOTERO_LIBRARY_ID and ZOTERO_API_KEY."
         )
 
-    return zotero.Zotero(
-        library_id=library_id,
-        library_type=library_type,
-        api_key=api_key,
-        local=False,
-    )
+    cache = _client_cache()
+    cache_key = ("web", cfg.library_id or "", cfg.library_type)
+    client = cache.get(cache_key)
+    if client is None:
+        client = _configure_http_pooling(
+            zotero.Zotero(
+                library_id=cfg.library_id,
+                library_type=cfg.library_type,
+                api_key=cfg.api_key,
+                local=False,
+            )
+        )
+        cache[cache_key] = client
+    return client
 
 
 def _resolve_client_mode(operation: Literal["read", "fulltext", "write"]) -> Literal["local", "web"]:
     """Resolve local vs web routing for an operation."""
-    read_mode = (os.getenv("ZOTERO_READ_MODE", "auto") or "auto").strip().lower()
-    write_mode = (os.getenv("ZOTERO_WRITE_MODE", "auto") or "auto").strip().lower()
-
-    local_enabled = _is_truthy(os.getenv("ZOTERO_LOCAL"))
-    web_available = _web_config_available()
+    cfg = _load_env_config()
 
     if operation in {"read", "fulltext"}:
-        if read_mode == "local":
+        if cfg.read_mode == "local":
             return "local"
-        if read_mode == "web":
+        if cfg.read_mode == "web":
             return "web"
         # auto: prefer local for speed/offline/fulltext when available
-        if local_enabled:
+        if cfg.local:
             return "local"
         return "web"
 
     # write operation
-    if write_mode == "web":
+    if cfg.write_mode == "web":
         return "web"
-    if write_mode == "local":
+    if cfg.write_mode == "local":
         return "local"
     # auto: prefer web when credentials exist because local endpoint is read-only
-    if web_available:
+    if cfg.web_available:
         return "web"
-    if local_enabled:
+    if cfg.local:
         return "local"
     return "web"
 
 
-@dataclass
+# Constants for generate_bibtex, hoisted so bulk export flows don't rebuild
+# them per item.
+_BIBTEX_TYPE_MAP = {
+    "journalArticle": "article",
+    "book": "book",
+    "bookSection": "incollection",
+    "conferencePaper": "inproceedings",
+    "thesis": "phdthesis",
+    "report": "techreport",
+    "webpage": "misc",
+    "manuscript": "unpublished",
+}
+
+_BIBTEX_FIELD_MAPPINGS = [
+    ("title", "title"),
+    ("publicationTitle", "journal"),
+    ("volume", "volume"),
+    ("issue", "number"),
+    ("pages", "pages"),
+    ("publisher", "publisher"),
+    ("DOI", "doi"),
+    ("url", "url"),
+    ("abstractNote", "abstract"),
+]
+
+_BIBTEX_ESCAPE = str.maketrans({"{": "\\{", "}": "\\}"})
+
+# Matches a "Citation Key: xyz" line in an item's Extra field (as written by
+# Better BibTeX) in one pass, instead of lowercasing and scanning each line.
+_CITATION_KEY_RE = re.compile(r"(?im)^\s*citation[_\s-]*key\s*:\s*(\S.*?)\s*$")
+
+# Shared Better BibTeX client and cached availability probe. The probe is an
+# HTTP round-trip to the local Zotero instance, so bulk exports reuse the
+# result for a short window instead of re-probing per item.
+_bbt_client = None
+_bbt_probe: tuple[bool, float] = (False, 0.0)
+_BBT_PROBE_TTL = 5.0
+
+
+def _bbt_client_if_running():
+    """Return a shared Better BibTeX client when Zotero is reachable."""
+    global _bbt_client, _bbt_probe
+
+    now = time.monotonic()
+    running, checked_at = _bbt_probe
+    if now - checked_at < _BBT_PROBE_TTL:
+        return _bbt_client if running else None
+
+    try:
+        from zotero_mcp.better_bibtex_client import ZoteroBetterBibTexAPI
+
+        if _bbt_client is None:
+            _bbt_client = ZoteroBetterBibTexAPI()
+        running = _bbt_client.is_zotero_running()
+    except Exception:
+        running = False
+
+    _bbt_probe = (running, now)
+    return _bbt_client if running else None
+
+
+@dataclass(slots=True, frozen=True)
 class AttachmentDetails:
-    """Details about a Zotero attachment."""
+    """Details about a Zotero attachment.
+
+    Slotted and frozen: bulk scans create one per item, so instances skip
+    the per-object ``__dict__`` and can be deduplicated in sets.
+    """
 
     key: str
     title: str
@@ -142,44 +333,50 @@ def format_item_metadata(item: dict[str, Any], include_abstract: bool = True) ->
         f"**Type:** {item_type}",
         f"**Item Key:** {data.get('key')}",
     ]
+    # Bind the bound method once; this function runs per item in bulk renders.
+    append = lines.append
 
     # Date
     if date := data.get("date"):
-        lines.append(f"**Date:** {date}")
+        append(f"**Date:** {date}")
 
     # Authors/Creators
     if creators := data.get("creators", []):
-        lines.append(f"**Authors:** {format_creators(creators)}")
+        append(f"**Authors:** {format_creators(creators)}")
 
     # Publication details based on item type
     if item_type == "journalArticle":
         if journal := data.get("publicationTitle"):
-            journal_info = f"**Journal:** {journal}"
+            journal_parts = [f"**Journal:** {journal}"]
             if volume := data.get("volume"):
-                journal_info += f", Volume {volume}"
+                journal_parts.append(f"Volume {volume}")
             if issue := data.get("issue"):
-                journal_info += f", Issue {issue}"
+                journal_parts.append(f"Issue {issue}")
             if pages := data.get("pages"):
-                journal_info += f", Pages {pages}"
-            lines.append(journal_info)
+                journal_parts.append(f"Pages {pages}")
+            append(", ".join(journal_parts))
     elif item_type == "book":
         if publisher := data.get("publisher"):
-            book_info = f"**Publisher:** {publisher}"
+            book_parts = [f"**Publisher:** {publisher}"]
             if place := data.get("place"):
-                book_info += f", {place}"
-            lines.append(book_info)
+                book_parts.append(place)
+            append(", ".join(book_parts))
 
     # DOI and URL
     if doi := data.get("DOI"):
-        lines.append(f"**DOI:** {doi}")
+        append(f"**DOI:** {doi}")
     if url := data.get("url"):
-        lines.append(f"**URL:** {url}")
+        append(f"**URL:** {url}")
+
+    # Citation key (from the Extra field, as written by Better BibTeX)
+    if extra := data.get("extra"):
+        if m := _CITATION_KEY_RE.search(extra):
+            append(f"**Citation Key:** {m.group(1)}")
 
     # Tags
     if tags := data.get("tags"):
-        tag_list = [f"`{tag['tag']}`" for tag in tags]
-        if tag_list:
-            lines.append(f"**Tags:** {' '.join(tag_list)}")
+        tag_list = " ".join(f"`{tag['tag']}`" for tag in tags)
+        append(f"**Tags:** {tag_list}")
 
     # Abstract
     if include_abstract and (abstract := data.get("abstractNote")):
@@ -187,12 +384,11 @@ def format_item_metadata(item: dict[str, Any], include_abstract: bool = True) ->
 
     # Collections
     if collections := data.get("collections", []):
-        if collections:
-            lines.append(f"**Collections:** {len(collections)} collections")
+        append(f"**Collections:** {len(collections)} collections")
 
     # Notes - this requires additional API calls, so we just indicate if there are notes
     if "meta" in item and item["meta"].get("numChildren", 0) > 0:
-        lines.append(f"**Notes/Attachments:** {item['meta']['numChildren']}")
+        append(f"**Notes/Attachments:** {item['meta']['numChildren']}")
 
     return "\n\n".join(lines)
 
@@ -212,10 +408,8 @@ def generate_bibtex(item: dict[str, Any]) -> str:
 
     # Try Better BibTeX first
     try:
-        from zotero_mcp.better_bibtex_client import ZoteroBetterBibTexAPI
-        bibtex = ZoteroBetterBibTexAPI()
-
-        if bibtex.is_zotero_running():
+        bibtex = _bbt_client_if_running()
+        if bibtex is not None:
             return bibtex.export_bibtex(item_key)
 
     except Exception:
@@ -228,18 +422,6 @@ def generate_bibtex(item: dict[str, Any]) -> str:
     if item_type in ["attachment", "note"]:
         raise ValueError(f"Cannot export BibTeX for item type '{item_type}'")
 
-    # Map Zotero item types to BibTeX types
-    type_map = {
-        "journalArticle": "article",
-        "book": "book",
-        "bookSection": "incollection",
-        "conferencePaper": "inproceedings",
-        "thesis": "phdthesis",
-        "report": "techreport",
-        "webpage": "misc",
-        "manuscript": "unpublished"
-    }
-
     # Create citation key
     creators = data.get("creators", [])
     author = ""
@@ -250,55 +432,58 @@ def generate_bibtex(item: dict[str, Any]) -> str:
     year = data.get("date", "")[:4] if data.get("date") else "nodate"
     cite_key = f"{author}{year}_{item_key}"
 
-    # Build BibTeX entry
-    bib_type = type_map.get(item_type, "misc")
-    lines = [f"@{bib_type}{{{cite_key},"]
+    # Build BibTeX entry; fields are collected without trailing commas and
+    # joined with ",\n" so no last-line trimming is needed.
+    bib_type = _BIBTEX_TYPE_MAP.get(item_type, "misc")
+    field_lines = []
 
     # Add fields
-    field_mappings = [
-        ("title", "title"),
-        ("publicationTitle", "journal"),
-        ("volume", "volume"),
-        ("issue", "number"),
-        ("pages", "pages"),
-        ("publisher", "publisher"),
-        ("DOI", "doi"),
-        ("url", "url"),
-        ("abstractNote", "abstract")
-    ]
-
-    for zotero_field, bibtex_field in field_mappings:
+    for zotero_field, bibtex_field in _BIBTEX_FIELD_MAPPINGS:
         if value := data.get(zotero_field):
             # Escape special characters
-            value = value.replace("{", "\\{").replace("}", "\\}")
-            lines.append(f'  {bibtex_field} = {{{value}}},')
+            value = value.translate(_BIBTEX_ESCAPE)
+            field_lines.append(f'  {bibtex_field} = {{{value}}}')
 
-    # Add authors
+    # Add authors in a single pass, feeding join directly from a generator
     if creators:
-        authors = []
-        for creator in creators:
-            if creator.get("creatorType") == "author":
-                if "lastName" in creator and "firstName" in creator:
-                    authors.append(f"{creator['lastName']}, {creator['firstName']}")
-                elif "name" in creator:
-                    authors.append(creator["name"])
+        authors = " and ".join(
+            name
+            for creator in creators
+            if creator.get("creatorType") == "author"
+            for name in (
+                f"{creator['lastName']}, {creator['firstName']}"
+                if "lastName" in creator and "firstName" in creator
+                else creator.get("name", ""),
+            )
+            if name
+        )
         if authors:
-            lines.append(f'  author = {{{" and ".join(authors)}}},')
+            field_lines.append(f'  author = {{{authors}}}')
 
     # Add year
     if year != "nodate":
-        lines.append(f'  year = {{{year}}},')
+        field_lines.append(f'  year = {{{year}}}')
+
+    body = ",\n".join(field_lines)
+    return f"@{bib_type}{{{cite_key},\n{body}\n}}"
 
-    # Remove trailing comma from last field and close entry
-    if lines[-1].endswith(','):
-        lines[-1] = lines[-1][:-1]
-    lines.append("}")
 
-    return "\n".join(lines)
+# Content-type buckets for attachment preference, most useful first. Exact
+# matches hit the dict; prefixes catch parameterised types such as
+# "text/html; charset=utf-8".
+_MIME_BUCKETS = {
+    "application/pdf": "pdf",
+    "text/html": "html",
+    "application/epub+zip": "epub",
+}
+_MIME_PREFIX_BUCKETS = (("text/html", "html"),)
+_BUCKET_PRIORITY = ("pdf", "html", "epub", "other")
 
 
 def get_attachment_details(
-    zot: zotero.Zotero, item: dict[str, Any]
+    zot: zotero.Zotero,
+    item: dict[str, Any],
+    children: list[dict[str, Any]] | None = None,
 ) -> AttachmentDetails | None:
     """
     Get attachment details for a Zotero item, finding the most relevant attachment.
@@ -306,6 +491,8 @@ def get_attachment_details(
     Args:
         zot: A Zotero client instance.
         item: A Zotero item dictionary.
+        children: Already-fetched child items, if the caller has them; saves
+            the children() round-trip.
 
     Returns:
         AttachmentDetails if found, None otherwise.
@@ -325,12 +512,11 @@ def get_attachment_details(
 
     # For regular items, look for child attachments
     try:
-        children = zot.children(item_key)
+        if children is None:
+            children = zot.children(item_key)
 
-        # Group attachments by content type
-        pdfs = []
-        htmls = []
-        others = []
+        # Track the largest attachment per content-type bucket in one pass
+        best: dict[str, tuple[int, str, str, str, str]] = {}
 
         for child in children:
             child_data = child.get("data", {})
@@ -343,33 +529,137 @@ def get_attachment_details(
                 # Use MD5 as proxy for size (longer MD5 usually means larger file)
                 size_proxy = len(child_data.get("md5", ""))
 
-                attachment = (key, title, filename, content_type, size_proxy)
-
-                if content_type == "application/pdf":
-                    pdfs.append(attachment)
-                elif content_type.startswith("text/html"):
-                    htmls.append(attachment)
-                else:
-                    others.append(attachment)
-
-        # Return first match in priority order (PDF > HTML > other)
-        # Sort each category by size (descending) to get largest/most complete file
-        for category in [pdfs, htmls, others]:
-            if category:
-                category.sort(key=lambda x: x[4], reverse=True)
-                key, title, filename, content_type, _ = category[0]
-                return AttachmentDetails(
-                    key=key,
-                    title=title,
-                    filename=filename,
-                    content_type=content_type,
+                attachment = (size_proxy, key, title, filename, content_type)
+
+                bucket = _MIME_BUCKETS.get(content_type) or next(
+                    (b for prefix, b in _MIME_PREFIX_BUCKETS if content_type.startswith(prefix)),
+                    "other",
                 )
+                current = best.get(bucket)
+                if current is None or attachment[0] > current[0]:
+                    best[bucket] = attachment
+
+        # Return first match in bucket priority order
+        chosen = next((best[b] for b in _BUCKET_PRIORITY if b in best), None)
+        if chosen:
+            _, key, title, filename, content_type = chosen
+            return AttachmentDetails(
+                key=key,
+                title=title,
+                filename=filename,
+                content_type=content_type,
+            )
     except Exception:
         pass
 
     return None
 
 
+# Zotero web API caps multi-key item requests at 50 keys.
+_ITEM_KEY_CHUNK = 50
+
+
+def get_attachment_details_bulk(
+    zot: zotero.Zotero, items: list[dict[str, Any]]
+) -> dict[str, AttachmentDetails | None]:
+    """
+    Resolve the most relevant attachment for many items with batched fetches.
+
+    Uses each item's primary-attachment link (present in web API responses)
+    to collect attachment keys, then fetches them in chunks of 50 with one
+    request per chunk instead of one children() call per item. Items without
+    a usable link fall back to the single-item path.
+
+    Args:
+        zot: A Zotero client instance.
+        items: Zotero item dictionaries.
+
+    Returns:
+        Mapping of parent item key to AttachmentDetails (or None).
+    """
+    results: dict[str, AttachmentDetails | None] = {}
+    pending: dict[str, str] = {}  # attachment key -> parent item key
+    by_key: dict[str, dict[str, Any]] = {}
+
+    for item in items:
+        data = item.get("data", {})
+        item_key = data.get("key") or item.get("key", "")
+        if not item_key:
+            continue
+        by_key[item_key] = item
+
+        if data.get("itemType") == "attachment":
+            results[item_key] = get_attachment_details(zot, item)
+            continue
+
+        href = item.get("links", {}).get("attachment", {}).get("href", "")
+        attachment_key = href.rstrip("/").rsplit("/", 1)[-1] if href else ""
+        if attachment_key:
+            pending[attachment_key] = item_key
+
+    attachment_keys = list(pending)
+    for i in range(0, len(attachment_keys), _ITEM_KEY_CHUNK):
+        chunk = attachment_keys[i : i + _ITEM_KEY_CHUNK]
+        try:
+            fetched = zot.items(itemKey=",".join(chunk))
+        except Exception:
+            continue
+        for attachment in fetched:
+            att_data = attachment.get("data", {})
+            parent_key = pending.get(att_data.get("key", ""))
+            if parent_key:
+                results[parent_key] = AttachmentDetails(
+                    key=att_data.get("key", ""),
+                    title=att_data.get("title", "Untitled"),
+                    filename=att_data.get("filename", ""),
+                    content_type=att_data.get("contentType", ""),
+                )
+
+    # Anything unresolved (no link, or a chunk fetch failed) uses the
+    # per-item path.
+    for item_key, item in by_key.items():
+        if item_key not in results:
+            results[item_key] = get_attachment_details(zot, item)
+
+    return results
+
+
+def get_attachment_details_many(
+    zot: zotero.Zotero,
+    items: list[dict[str, Any]],
+    *,
+    max_workers: int = 8,
+) -> list[AttachmentDetails | None]:
+    """
+    Resolve attachments for many items concurrently, preserving order.
+
+    Unlike get_attachment_details_bulk this does not need the web API's
+    primary-attachment links: it fans the per-item children() calls out
+    across a bounded thread pool, so N round-trips overlap instead of
+    running back to back. The client's HTTP pool is safe for concurrent
+    independent requests.
+
+    Args:
+        zot: A Zotero client instance.
+        items: Zotero item dictionaries.
+        max_workers: Upper bound on concurrent requests.
+
+    Returns:
+        AttachmentDetails (or None) for each item, in input order.
+    """
+    if len(items) <= 1:
+        return [get_attachment_details(zot, item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(lambda item: get_attachment_details(zot, item), items))
+
+
+# Lazily created MarkItDown converter. Importing markitdown pulls in a large
+# dependency graph, so defer it until a conversion is actually requested and
+# reuse the instance afterwards.
+_md_instance = None
+
+
 def convert_to_markdown(file_path: str | Path) -> str:
     """
     Convert a file to markdown using markitdown library.
@@ -380,9 +670,33 @@ def convert_to_markdown(file_path: str | Path) -> str:
     Returns:
         Markdown text.
     """
+    global _md_instance
     try:
-        md = MarkItDown()
-        result = md.convert(str(file_path))
+        if _md_instance is None:
+            from markitdown import MarkItDown
+
+            _md_instance = MarkItDown()
+        result = _md_instance.convert(str(file_path))
         return result.text_content
     except Exception as e:
         return f"Error converting file to markdown: {str(e)}"
+
+
+def iter_markdown(file_path: str | Path, chunk_size: int = 64 * 1024) -> Iterator[str]:
+    """
+    Convert a file to markdown, yielding the text in chunks.
+
+    Streaming variant of convert_to_markdown for large documents: callers
+    can forward chunks as they arrive instead of holding an extra copy of
+    the full text while assembling a response.
+
+    Args:
+        file_path: Path to the file to convert.
+        chunk_size: Size of each yielded chunk in characters.
+
+    Yields:
+        Successive slices of the markdown text.
+    """
+    text = convert_to_markdown(file_path)
+    for i in range(0, len(text), chunk_size):
+        yield text[i : i + chunk_size]
@@ -5,10 +5,12 @@ Provides direct SQLite access to Zotero's local database for faster semantic sea
 when running in local mode.
 """
 
+import atexit
 import os
 import sqlite3
 import platform
 import logging
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
@@ -124,10 +126,26 @@ class LocalZoteroReader:
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection, creating if needed."""
         if self._connection is None:
-            # Open in read-only mode for safety
+            # Open in read-only mode for safety. The shared reader is
+            # called from whichever FastMCP worker thread runs the tool,
+            # so allow cross-thread use; Python's sqlite3 serializes
+            # access and the connection never writes.
             uri = f"file:{self.db_path}?mode=ro"
-            self._connection = sqlite3.connect(uri, uri=True)
+            self._connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
             self._connection.row_factory = sqlite3.Row
+            # Read-side tuning: a bigger page cache (20 MB), in-memory temp
+            # tables for the GROUP_CONCAT aggregations, and a busy timeout so
+            # reads wait out Zotero's own writes instead of failing with
+            # SQLITE_BUSY. journal_mode/synchronous are left alone — this
+            # connection is read-only and never touches the journal.
+            try:
+                self._connection.executescript(
+                    "PRAGMA cache_size=-20000;"
+                    "PRAGMA temp_store=MEMORY;"
+                    "PRAGMA busy_timeout=5000;"
+                )
+            except sqlite3.Error:
+                pass
         return self._connection
 
     def _get_storage_dir(self) -> Path:
@@ -280,12 +298,18 @@ class LocalZoteroReader:
         )
         return cursor.fetchone()[0]
 
-    def get_items_with_text(self, limit: int | None = None, include_fulltext: bool = False) -> list[ZoteroItem]:
+    def get_items_with_text(self, limit: int | None = None, include_fulltext: bool = False,
+                            key: str | None = None, search: str | None = None) -> list[ZoteroItem]:
         """
         Get all items with their text content for semantic search.
 
         Args:
             limit: Optional limit on number of items to return.
+            include_fulltext: Whether to extract attachment fulltext per item.
+            key: Optional Zotero item key; restricts the query to one item
+                via the indexed key column.
+            search: Optional substring to match (case-insensitively) against
+                title, abstract, creators, notes or extra, applied in SQL.
 
         Returns:
             List of ZoteroItem objects with text content.
@@ -343,17 +367,45 @@ class LocalZoteroReader:
         LEFT JOIN creators c ON ic.creatorID = c.creatorID
 
         WHERE it.typeName NOT IN ('attachment', 'note', 'annotation')
+        {key_filter}
 
         GROUP BY i.itemID, i.key, i.itemTypeID, it.typeName, i.dateAdded, i.dateModified,
                  title_val.value, abstract_val.value, extra_val.value
-
+        {search_filter}
         ORDER BY i.dateModified DESC
         """
 
+        params: list = []
+        if key is not None:
+            query = query.replace("{key_filter}", "AND i.key = ?")
+            params.append(key)
+        else:
+            query = query.replace("{key_filter}", "")
+
+        if search is not None:
+            # LIKE is case-insensitive for ASCII in SQLite, matching the old
+            # lowered-substring semantics; HAVING may reference the
+            # GROUP_CONCAT aliases. Escape LIKE metacharacters so %, _ and
+            # \ in the query match literally, as the Python `in` check did
+            query = query.replace(
+                "{search_filter}",
+                """HAVING (IFNULL(title, '') LIKE ? ESCAPE '\\'
+                   OR IFNULL(abstract, '') LIKE ? ESCAPE '\\'
+                   OR IFNULL(creators, '') LIKE ? ESCAPE '\\'
+                   OR IFNULL(notes, '') LIKE ? ESCAPE '\\'
+                   OR IFNULL(extra, '') LIKE ? ESCAPE '\\')""",
+            )
+            escaped = (
+                search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            )
+            params.extend([f"%{escaped}%"] * 5)
+        else:
+            query = query.replace("{search_filter}", "")
+
         if limit:
             query += f" LIMIT {limit}"
 
-        cursor = conn.execute(query)
+        cursor = conn.execute(query, params)
         items = []
 
         for row in cursor:
@@ -395,11 +447,8 @@ class LocalZoteroReader:
         Returns:
             ZoteroItem if found, None otherwise.
         """
-        items = self.get_items_with_text()
-        for item in items:
-            if item.key == key:
-                return item
-        return None
+        items = self.get_items_with_text(key=key)
+        return items[0] if items else None
 
     def search_items_by_text(self, query: str, limit: int = 50) -> list[ZoteroItem]:
         """
@@ -412,36 +461,53 @@ class LocalZoteroReader:
         Returns:
             List of matching ZoteroItem objects.
         """
-        items = self.get_items_with_text()
-        matching_items = []
+        # Filter in SQL rather than materializing the whole library and
+        # substring-scanning it in Python
+        return self.get_items_with_text(limit=limit, search=query)
+
 
-        query_lower = query.lower()
+# Shared reader instance. Opening zotero.sqlite per call costs far more
+# than the queries themselves, so callers get one lazily created reader
+# whose connection stays warm for the process lifetime.
+_reader_instance: LocalZoteroReader | None = None
 
-        for item in items:
-            searchable_text = item.get_searchable_text().lower()
-            if query_lower in searchable_text:
-                matching_items.append(item)
-                if len(matching_items) >= limit:
-                    break
 
-        return matching_items
+def _close_local_reader() -> None:
+    """Close the shared reader (registered with atexit)."""
+    global _reader_instance
+    if _reader_instance is not None:
+        _reader_instance.close()
+        _reader_instance = None
 
 
 def get_local_zotero_reader() -> LocalZoteroReader | None:
     """
-    Get a LocalZoteroReader instance if in local mode.
+    Get the shared LocalZoteroReader instance if in local mode.
 
     Returns:
         LocalZoteroReader instance if in local mode and database exists,
         None otherwise.
     """
+    global _reader_instance
+
     if not is_local_mode():
         return None
 
-    try:
-        return LocalZoteroReader()
-    except FileNotFoundError:
-        return None
+    if _reader_instance is None:
+        try:
+            _reader_instance = LocalZoteroReader()
+        except FileNotFoundError:
+            return None
+        atexit.register(_close_local_reader)
+
+    return _reader_instance
+
+
+# Cached availability probe. A negative answer means a filesystem scan for
+# zotero.sqlite, so remember the result for a short window instead of
+# re-walking candidate paths on every check.
+_db_probe: tuple[bool, float] = (False, 0.0)
+_DB_PROBE_TTL = 30.0
 
 
 def is_local_db_available() -> bool:
@@ -451,8 +517,13 @@ def is_local_db_available() -> bool:
     Returns:
         True if local database can be accessed, False otherwise.
     """
-    reader = get_local_zotero_reader()
-    if reader:
-        reader.close()
-        return True
-    return False
\ No newline at end of file
+    global _db_probe
+
+    now = time.monotonic()
+    available, checked_at = _db_probe
+    if now - checked_at < _DB_PROBE_TTL:
+        return available
+
+    available = get_local_zotero_reader() is not None
+    _db_probe = (available, now)
+    return available
\ No newline at end of file
@@ -8,34 +8,63 @@ are defined and used and piped through to the main server tools. See bottom of f
 from typing import Dict, List, Literal, Optional, Union
 import os
 import sys
+import functools
+import itertools
 import uuid
 import asyncio
+import io
 import json
+import html
 import re
+import tempfile
+import logging
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastmcp import Context, FastMCP
 
+from zotero_mcp.better_bibtex_client import (
+    get_color_category,
+    process_annotation,
+)
+from zotero_mcp.pdfannots_helper import (
+    ensure_pdfannots_installed,
+    extract_annotations_from_pdf,
+)
 from zotero_mcp.client import (
+    _CITATION_KEY_RE,
+    _bbt_client_if_running,
     convert_to_markdown,
     format_item_metadata,
     generate_bibtex,
     get_attachment_details,
     get_zotero_client,
 )
-from zotero_mcp.utils import format_creators
+from zotero_mcp.utils import format_creators, is_local_mode
+
+# Startup/shutdown messages go through logging rather than raw stderr
+# writes: one syscall per record, and level checks skip the message
+# formatting entirely when disabled.
+logger = logging.getLogger("zotero-mcp")
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stderr)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP):
     """Manage server startup and shutdown lifecycle."""
-    sys.stderr.write("Starting Zotero MCP server...\n")
+    logger.info("Starting Zotero MCP server...")
 
     if not _semantic_tools_enabled():
-        sys.stderr.write("Semantic MCP tools disabled by ZOTERO_ENABLE_SEMANTIC_TOOLS=false\n")
+        logger.info("Semantic MCP tools disabled by ZOTERO_ENABLE_SEMANTIC_TOOLS=false")
         yield {}
-        sys.stderr.write("Shutting down Zotero MCP server...\n")
+        logger.info("Shutting down Zotero MCP server...")
         return
 
     # Check for semantic search auto-update on startup
@@ -48,25 +77,25 @@ async def server_lifespan(server: FastMCP):
             search = create_semantic_search(str(config_path))
 
             if search.should_update_database():
-                sys.stderr.write("Auto-updating semantic search database...\n")
+                logger.info("Auto-updating semantic search database...")
 
                 # Run update in background to avoid blocking server startup
                 async def background_update():
                     try:
                         stats = search.update_database(extract_fulltext=False)
-                        sys.stderr.write(f"Database update completed: {stats.get('processed_items', 0)} items processed\n")
+                        logger.info("Database update completed: %s items processed", stats.get("processed_items", 0))
                     except Exception as e:
-                        sys.stderr.write(f"Background database update failed: {e}\n")
+                        logger.error("Background database update failed: %s", e)
 
                 # Start background task
                 asyncio.create_task(background_update())
 
     except Exception as e:
-        sys.stderr.write(f"Warning: Could not check semantic search auto-update: {e}\n")
+        logger.warning("Could not check semantic search auto-update: %s", e)
 
     yield {}
 
-    sys.stderr.write("Shutting down Zotero MCP server...\n")
+    logger.info("Shutting down Zotero MCP server...")
 
 
 # Create an MCP server (fastmcp 2.14+ no longer accepts `dependencies`)
@@ -123,42 +152,175 @@ def _read_job(job_id: str) -> dict | None:
         return json.load(f)
 
 
+_CASE_FUNCS = {"lower": str.lower, "upper": str.upper, "title": str.title}
+
+
 def _normalize_tag_list(
     tags: list[dict],
     tag_mapping: dict[str, str] | None,
     case_mode: str,
     trim_whitespace: bool
 ) -> tuple[list[dict], bool]:
-    """Return normalized tags list and whether any changes occurred."""
-    normalized = []
-    seen = set()
-    changed = False
-
+    """Return normalized tags list and whether any changes occurred.
+
+    Mapping values are applied as-is; callers that combine a mapping
+    with a case rule pre-fold it once via `_fuse_tag_mapping` instead of
+    paying the case conversion per mapped tag per item.
+    """
+    # Fast path: when no rule can rewrite a tag and the list is already
+    # unique and free of empties, return the input untouched
+    if case_mode not in _CASE_FUNCS and not tag_mapping:
+        values = [t.get("tag", "") for t in tags]
+        if (
+            (not trim_whitespace or all(v == v.strip() for v in values))
+            and all(values)
+            and len(set(values)) == len(values)
+        ):
+            return tags, False
+
+    # Resolve the per-tag decisions once, outside the loop
+    case_fn = _CASE_FUNCS.get(case_mode)
+    mapping = tag_mapping or {}
+
+    pairs = []
     for tag_obj in tags:
         tag_value = tag_obj.get("tag", "")
-        new_value = tag_value
+        new_value = tag_value.strip() if trim_whitespace else tag_value
+        mapped = mapping.get(new_value)
+        if mapped is not None:
+            new_value = mapped
+        elif case_fn is not None:
+            new_value = case_fn(new_value)
+        pairs.append((tag_value, new_value))
+
+    changed = any(old != new for old, new in pairs)
+    # dict.fromkeys gives order-preserving dedup without a separate seen set
+    normalized = [{"tag": t} for t in dict.fromkeys(new for _, new in pairs if new)]
+    return normalized, changed
 
-        if trim_whitespace:
-            new_value = new_value.strip()
 
-        if tag_mapping and new_value in tag_mapping:
-            new_value = tag_mapping[new_value]
+def _fuse_tag_mapping(
+    tag_mapping: dict[str, str] | None,
+    case_mode: str
+) -> dict[str, str] | None:
+    """Pre-apply the case rule to mapping values, once per tool call.
+
+    `_normalize_tag_list` treats mapped values as final, so folding the
+    case conversion into the mapping here turns mapping-plus-case into a
+    single dict lookup inside the per-item loop.
+    """
+    if not tag_mapping:
+        return tag_mapping
+    case_fn = _CASE_FUNCS.get(case_mode)
+    if case_fn is None:
+        return tag_mapping
+    return {k: case_fn(v) for k, v in tag_mapping.items()}
+
+
+def _iter_items(zot, limit: int, page_size: int = 50, **params):
+    """Yield up to `limit` items, fetching pages of `page_size` lazily.
+
+    Keeps peak memory proportional to one page rather than the full
+    result set; `params` are forwarded to `zot.add_parameters`.
+    """
+    zot.add_parameters(limit=min(page_size, limit), **params)
+    yielded = 0
+    for page in zot.makeiter(zot.items()):
+        for item in page:
+            yield item
+            yielded += 1
+            if yielded >= limit:
+                return
+
+
+def _coerce_int_args(*names):
+    """Coerce named string arguments to int before the tool body runs.
+
+    MCP clients sometimes send numeric parameters such as ``limit`` as
+    strings; converting once here keeps each tool body on a single typed
+    path instead of repeating the isinstance check inline.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            for name in names:
+                value = kwargs.get(name)
+                if isinstance(value, str):
+                    try:
+                        kwargs[name] = int(value)
+                    except ValueError:
+                        return f"Error: '{name}' must be an integer, got {value!r}"
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
 
-        if case_mode == "lower":
-            new_value = new_value.lower()
-        elif case_mode == "upper":
-            new_value = new_value.upper()
-        elif case_mode == "title":
-            new_value = new_value.title()
 
-        if new_value != tag_value:
-            changed = True
+def _format_item_block(i: int, item: dict, write, *, details: bool = True) -> None:
+    """Write one numbered markdown result block for an item.
 
-        if new_value and new_value not in seen:
-            normalized.append({"tag": new_value})
-            seen.add(new_value)
+    Shared by the search/list tools so the per-item hot loop runs from a
+    single code object. ``write`` is the caller's buffer write, bound to a
+    local at the call site.
 
-    return normalized, changed
+    Args:
+        i: 1-based position of the item in the result list.
+        item: Zotero item dictionary.
+        write: Callable receiving each output chunk.
+        details: Whether to include the abstract snippet and tags.
+    """
+    # Bind the data getter once; the loop over result items makes this the
+    # hottest dict access in the formatter tools.
+    get = item.get("data", {}).get
+    write(f"## {i}. {get('title', 'Untitled')}\n")
+    write(f"**Type:** {get('itemType', 'unknown')}\n")
+    write(f"**Item Key:** {item.get('key', '')}\n")
+    write(f"**Date:** {get('date', 'No date')}\n")
+    write(f"**Authors:** {format_creators(get('creators', []))}\n")
+
+    if details:
+        # Limit abstract length for search results; the slice is a no-op
+        # copy for short abstracts, so only the ellipsis is conditional
+        if abstract := get("abstractNote"):
+            write(f"**Abstract:** {_snippet(abstract)}\n")
+
+        if tags := get("tags"):
+            tag_list = " ".join(f"`{t['tag']}`" for t in tags)
+            write(f"**Tags:** {tag_list}\n")
+
+    write("\n")  # Empty line between items
+
+
+# Single-pass note HTML cleanup: one compiled scan replaces the chained
+# str.replace calls, which each copied the whole note body.
+_NOTE_HTML_RE = re.compile(r"<p>|</p>|<br\s*/?>")
+_NOTE_HTML_REPLACEMENTS = {"<p>": "", "</p>": "\n\n"}
+
+
+def _clean_note_html(note_text: str) -> str:
+    """Strip paragraph tags and convert breaks to newlines in one pass."""
+    return _NOTE_HTML_RE.sub(
+        lambda m: _NOTE_HTML_REPLACEMENTS.get(m.group(0), "\n"), note_text
+    )
+
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+
+def _snippet(text: str, n: int = 200, strip_html: bool = False) -> str:
+    """Collapse a text fragment into a one-line snippet of ~n chars.
+
+    Tag stripping is opt-in: abstracts are plain text where ``<`` and
+    ``>`` appear literally (``p<0.05``), so only call sites that hold
+    known HTML should set ``strip_html``. The input is sliced before
+    cleaning so long bodies never pay for text that cannot appear in the
+    snippet.
+    """
+    text = text[: n * 4]
+    if strip_html:
+        text = _TAG_RE.sub(" ", text)
+    text = _WS_RE.sub(" ", text).strip()
+    return text[:n] + "..." if len(text) > n else text
 
 
 _ADVANCED_FIELD_ALIASES = {
@@ -246,6 +408,7 @@ _ADVANCED_ALLOWED_OPERATORS = {
 _ADVANCED_OPS_WITHOUT_VALUE = {"exists", "doesNotExist", "isEmpty", "isNotEmpty"}
 
 
+@functools.lru_cache(maxsize=256)
 def _normalize_field(field: str) -> str:
     key = field.strip()
     if not key:
@@ -260,6 +423,7 @@ def _normalize_field(field: str) -> str:
     return key
 
 
+@functools.lru_cache(maxsize=256)
 def _normalize_operator(op: str) -> str:
     if not op:
         return ""
@@ -323,6 +487,39 @@ def _normalize_advanced_conditions(
     return normalized
 
 
+def _direct_search_params(conditions: list[dict[str, str]], join_mode: str) -> dict | None:
+    """Map simple ANDed conditions onto direct item-endpoint parameters.
+
+    Exact tag and itemType conditions are expressible as plain query
+    parameters, which saves the two write round-trips of creating and
+    deleting a temporary saved search. Substring operators (and anything
+    else the endpoint cannot express with the same semantics) return None
+    so the caller falls back to the saved-search machinery.
+    """
+    if join_mode != "all":
+        return None
+
+    params: dict = {}
+    tags: list[str] = []
+    for cond in conditions:
+        field = cond.get("condition")
+        op = cond.get("operator")
+        value = cond.get("value", "")
+        # The tag= parameter is an exact match, so only map the exact
+        # operators; "contains" needs the saved search
+        if field == "tag" and op == "is":
+            tags.append(value)
+        elif field == "tag" and op == "isNot":
+            tags.append(f"-{value}")
+        elif field == "itemType" and op == "is" and "itemType" not in params:
+            params["itemType"] = value
+        else:
+            return None
+    if tags:
+        params["tag"] = tags
+    return params or None
+
+
 def _tokenize_query(query: str) -> list[str]:
     tokens = []
     buf = []
@@ -438,6 +635,7 @@ def _parse_advanced_query(query: str) -> tuple[list[dict[str, str]], str | None]
     name="zotero_search_items",
     description="Search for items in your Zotero library, given a query string."
 )
+@_coerce_int_args("limit")
 def search_items(
     query: str,
     qmode: Literal["titleCreatorYear", "everything"] = "titleCreatorYear",
@@ -474,9 +672,6 @@ def search_items(
         ctx.info(f"Searching Zotero for '{query}'{tag_condition_str}")
         zot = get_zotero_client(operation="read")
 
-        if isinstance(limit, str):
-            limit = int(limit)
-
         # Search using the query parameters
         zot.add_parameters(q=query, qmode=qmode, itemType=item_type, limit=limit, tag=tag)
         results = zot.items()
@@ -485,41 +680,14 @@ def search_items(
             return f"No items found matching query: '{query}'{tag_condition_str}"
 
         # Format results as markdown
-        output = [f"# Search Results for '{query}'", f"{tag_condition_str}", ""]
+        buf = io.StringIO()
+        write = buf.write
+        write(f"# Search Results for '{query}'\n{tag_condition_str}\n\n")
 
         for i, item in enumerate(results, 1):
-            data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
-
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
-
-            # Build the formatted entry
-            output.append(f"## {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Authors:** {creators_str}")
-
-            # Add abstract snippet if present
-            if abstract := data.get("abstractNote"):
-                # Limit abstract length for search results
-                abstract_snippet = abstract[:200] + "..." if len(abstract) > 200 else abstract
-                output.append(f"**Abstract:** {abstract_snippet}")
-
-            # Add tags if present
-            if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
-
-            output.append("")  # Empty line between items
+            _format_item_block(i, item, write)
 
-        return "\n".join(output)
+        return buf.getvalue().rstrip("\n")
 
     except Exception as e:
         ctx.error(f"Error searching Zotero: {str(e)}")
@@ -530,6 +698,7 @@ def search_items(
     description="Search for items in your Zotero library by tag. " \
     "Conditions are ANDed, each term supports disjunction`||` and exclusion`-`."
 )
+@_coerce_int_args("limit")
 def search_by_tag(
     tag: list[str],
     item_type: str = "-attachment",
@@ -565,9 +734,6 @@ def search_by_tag(
         ctx.info(f"Searching Zotero for tag '{tag}'")
         zot = get_zotero_client(operation="read")
 
-        if isinstance(limit, str):
-            limit = int(limit)
-
         # Search using the query parameters
         zot.add_parameters(q="", tag=tag, itemType=item_type, limit=limit)
         results = zot.items()
@@ -576,41 +742,14 @@ def search_by_tag(
             return f"No items found with tag: '{tag}'"
 
         # Format results as markdown
-        output = [f"# Search Results for Tag: '{tag}'", ""]
+        buf = io.StringIO()
+        write = buf.write
+        write(f"# Search Results for Tag: '{tag}'\n\n")
 
         for i, item in enumerate(results, 1):
-            data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
-
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
-
-            # Build the formatted entry
-            output.append(f"## {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Authors:** {creators_str}")
-
-            # Add abstract snippet if present
-            if abstract := data.get("abstractNote"):
-                # Limit abstract length for search results
-                abstract_snippet = abstract[:200] + "..." if len(abstract) > 200 else abstract
-                output.append(f"**Abstract:** {abstract_snippet}")
-
-            # Add tags if present
-            if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
+            _format_item_block(i, item, write)
 
-            output.append("")  # Empty line between items
-
-        return "\n".join(output)
+        return buf.getvalue().rstrip("\n")
 
     except Exception as e:
         ctx.error(f"Error searching Zotero: {str(e)}")
@@ -647,21 +786,142 @@ def get_item_metadata(
         if not item:
             return f"No item found with key: {item_key}"
 
-        if format == "bibtex":
-            return generate_bibtex(item)
-        else:
-            return format_item_metadata(item, include_abstract)
+        return _format_item_cached(item, include_abstract, format)
 
     except Exception as e:
         ctx.error(f"Error fetching item metadata: {str(e)}")
         return f"Error fetching item metadata: {str(e)}"
 
 
+# Formatted-metadata cache keyed by (key, version, include_abstract, fmt).
+# Zotero bumps an item's version on every change, so entries stay valid and
+# re-requests of the same item skip the string-heavy formatting. FIFO
+# eviction keeps the cache bounded.
+_FORMAT_CACHE_MAX = 256
+_format_cache: dict[tuple[str, int, bool, str], str] = {}
+
+
+def _format_item_cached(item: dict, include_abstract: bool, fmt: str) -> str:
+    """Format an item as markdown or BibTeX, reusing per-version results."""
+    cache_key = (
+        item.get("key", ""),
+        item.get("version") or item.get("data", {}).get("version", 0),
+        include_abstract,
+        fmt,
+    )
+    cached = _format_cache.get(cache_key)
+    if cached is None:
+        if fmt == "bibtex":
+            cached = generate_bibtex(item)
+        else:
+            cached = format_item_metadata(item, include_abstract)
+        if len(_format_cache) >= _FORMAT_CACHE_MAX:
+            _format_cache.pop(next(iter(_format_cache)))
+        _format_cache[cache_key] = cached
+    return cached
+
+
+# Process pool for PDF-to-markdown conversion, created on first use so pure
+# metadata workloads never pay the worker startup cost. Conversion is CPU-
+# bound and holds the GIL, so separate processes let concurrent fulltext
+# requests use real cores.
+_conversion_pool = None
+
+
+def _get_conversion_pool():
+    global _conversion_pool
+    if _conversion_pool is None:
+        import concurrent.futures
+        import multiprocessing
+
+        # Spawn rather than fork: the pool is created lazily from a worker
+        # thread of an already multi-threaded server, and forked children
+        # can deadlock on inherited locks
+        _conversion_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max(2, (os.cpu_count() or 2) // 2),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _conversion_pool
+
+
+def _download_and_convert(zot, attachment) -> str | None:
+    """Download an attachment to a temp dir and convert it to markdown.
+
+    Blocking helper for get_item_fulltext; runs in a worker thread. The
+    conversion itself is handed to the process pool so the temp directory
+    stays alive until the worker finishes. Returns None when the download
+    produced no file.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        file_path = os.path.join(tmpdir, attachment.filename or f"{attachment.key}.pdf")
+        zot.dump(attachment.key, filename=os.path.basename(file_path), path=tmpdir)
+
+        if not os.path.exists(file_path):
+            return None
+        try:
+            return _get_conversion_pool().submit(convert_to_markdown, file_path).result()
+        except Exception:
+            # Process pools can be unavailable (restricted environments);
+            # fall back to converting in this thread.
+            return convert_to_markdown(file_path)
+
+
+def _extract_one_pdf(zot, attachment: dict, item_key: str) -> list[dict]:
+    """Download one PDF attachment and extract its annotations.
+
+    Blocking helper for get_annotations' PDF-extraction fallback; runs in a
+    worker thread so several attachments can be processed concurrently.
+    Returns Zotero-shaped annotation dicts.
+    """
+    annotations: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        att_key = attachment.get("key", "")
+        file_path = os.path.join(tmpdir, f"{att_key}.pdf")
+        zot.dump(att_key, file_path)
+
+        if not os.path.exists(file_path):
+            return annotations
+
+        for ext in extract_annotations_from_pdf(file_path, tmpdir):
+            # Skip empty annotations
+            if not ext.get("annotatedText") and not ext.get("comment"):
+                continue
+
+            # Create Zotero-like annotation object
+            pdf_anno = {
+                "key": f"pdf_{att_key}_{ext.get('id', uuid.uuid4().hex[:8])}",
+                "data": {
+                    "itemType": "annotation",
+                    "annotationType": ext.get("type", "highlight"),
+                    "annotationText": ext.get("annotatedText", ""),
+                    "annotationComment": ext.get("comment", ""),
+                    "annotationColor": ext.get("color", ""),
+                    "parentItem": item_key,
+                    "tags": [],
+                    "_pdf_page": ext.get("page", 0),
+                    "_from_pdf_extraction": True,
+                    "_attachment_title": attachment.get("data", {}).get("title", "PDF")
+                }
+            }
+
+            # Handle image annotations; record existence now, while the
+            # temp directory is still alive — the render loop runs after
+            # it has been cleaned up
+            if ext.get("type") == "image" and ext.get("imageRelativePath"):
+                image_path = os.path.join(tmpdir, ext.get("imageRelativePath"))
+                pdf_anno["data"]["_image_path"] = image_path
+                pdf_anno["data"]["_image_exists"] = os.path.exists(image_path)
+
+            annotations.append(pdf_anno)
+
+    return annotations
+
+
 @mcp.tool(
     name="zotero_get_item_fulltext",
     description="Get the full text content of a Zotero item by its key."
 )
-def get_item_fulltext(
+async def get_item_fulltext(
     item_key: str,
     *,
     ctx: Context
@@ -669,6 +929,9 @@ def get_item_fulltext(
     """
     Get the full text content of a Zotero item.
 
+    The HTTP calls and PDF conversion are blocking, so they run in worker
+    threads to keep the event loop free for concurrent tool calls.
+
     Args:
         item_key: Zotero item key/ID
         ctx: MCP context
@@ -681,7 +944,7 @@ def get_item_fulltext(
         zot = get_zotero_client(operation="fulltext")
 
         # First get the item metadata
-        item = zot.item(item_key)
+        item = await asyncio.to_thread(zot.item, item_key)
         if not item:
             return f"No item found with key: {item_key}"
 
@@ -689,7 +952,7 @@ def get_item_fulltext(
         metadata = format_item_metadata(item, include_abstract=True)
 
         # Try to get attachment details
-        attachment = get_attachment_details(zot, item)
+        attachment = await asyncio.to_thread(get_attachment_details, zot, item)
         if not attachment:
             return f"{metadata}\n\n---\n\nNo suitable attachment found for this item."
 
@@ -697,7 +960,7 @@ def get_item_fulltext(
 
         # Try fetching full text from Zotero's full text index first
         try:
-            full_text_data = zot.fulltext_item(attachment.key)
+            full_text_data = await asyncio.to_thread(zot.fulltext_item, attachment.key)
             if full_text_data and "content" in full_text_data and full_text_data["content"]:
                 ctx.info("Successfully retrieved full text from Zotero's index")
                 return f"{metadata}\n\n---\n\n## Full Text\n\n{full_text_data['content']}"
@@ -708,20 +971,10 @@ def get_item_fulltext(
         try:
             ctx.info(f"Attempting to download and convert attachment {attachment.key}")
 
-            # Download the file to a temporary location
-            import tempfile
-            import os
-
-            with tempfile.TemporaryDirectory() as tmpdir:
-                file_path = os.path.join(tmpdir, attachment.filename or f"{attachment.key}.pdf")
-                zot.dump(attachment.key, filename=os.path.basename(file_path), path=tmpdir)
-
-                if os.path.exists(file_path):
-                    ctx.info(f"Downloaded file to {file_path}, converting to markdown")
-                    converted_text = convert_to_markdown(file_path)
-                    return f"{metadata}\n\n---\n\n## Full Text\n\n{converted_text}"
-                else:
-                    return f"{metadata}\n\n---\n\nFile download failed."
+            converted_text = await asyncio.to_thread(_download_and_convert, zot, attachment)
+            if converted_text is not None:
+                return f"{metadata}\n\n---\n\n## Full Text\n\n{converted_text}"
+            return f"{metadata}\n\n---\n\nFile download failed."
         except Exception as download_error:
             ctx.error(f"Error downloading/converting file: {str(download_error)}")
             return f"{metadata}\n\n---\n\nError accessing attachment: {str(download_error)}"
@@ -735,6 +988,7 @@ def get_item_fulltext(
     name="zotero_get_collections",
     description="List all collections in your Zotero library."
 )
+@_coerce_int_args("limit")
 def get_collections(
     limit: int | str | None = None,
     *,
@@ -754,69 +1008,62 @@ def get_collections(
         ctx.info("Fetching collections")
         zot = get_zotero_client(operation="read")
 
-        if isinstance(limit, str):
-            limit = int(limit)
-
         collections = zot.collections(limit=limit)
 
-        # Always return the header, even if empty
-        output = ["# Zotero Collections", ""]
+        # Always return the header, even if empty. Stream into one buffer;
+        # deep hierarchies otherwise grow a large list of tiny strings.
+        buf = io.StringIO()
+        write = buf.write
+        write("# Zotero Collections\n\n")
 
         if not collections:
-            output.append("No collections found in your Zotero library.")
-            return "\n".join(output)
+            write("No collections found in your Zotero library.")
+            return buf.getvalue()
 
         # Create a mapping of collection IDs to their data
         collection_map = {c["key"]: c for c in collections}
 
-        # Create a mapping of parent to child collections
-        # Only add entries for collections that actually exist
-        hierarchy = {}
+        # Create a mapping of parent to child collections; defaultdict saves
+        # the membership check per collection
+        hierarchy = defaultdict(list)
         for coll in collections:
             parent_key = coll["data"].get("parentCollection")
             # Handle various representations of "no parent"
-            if parent_key in ["", None] or not parent_key:
+            if not parent_key:
                 parent_key = None  # Normalize to None
 
-            if parent_key not in hierarchy:
-                hierarchy[parent_key] = []
             hierarchy[parent_key].append(coll["key"])
 
-        # Function to recursively format collections
-        def format_collection(key, level=0):
-            if key not in collection_map:
-                return []
-
-            coll = collection_map[key]
-            name = coll["data"].get("name", "Unnamed Collection")
-
-            # Create indentation for hierarchy
-            indent = "  " * level
-            lines = [f"{indent}- **{name}** (Key: {key})"]
-
-            # Add children if they exist
-            child_keys = hierarchy.get(key, [])
-            for child_key in sorted(child_keys):  # Sort for consistent output
-                lines.extend(format_collection(child_key, level + 1))
-
-            return lines
+        # Sort each child list once up front for consistent output, instead
+        # of re-sorting on every visit
+        for child_keys in hierarchy.values():
+            child_keys.sort()
 
         # Start with top-level collections (those with None as parent)
         top_level_keys = hierarchy.get(None, [])
 
         if not top_level_keys:
             # If no clear hierarchy, just list all collections
-            output.append("Collections (flat list):")
+            write("Collections (flat list):\n")
             for coll in sorted(collections, key=lambda x: x["data"].get("name", "")):
                 name = coll["data"].get("name", "Unnamed Collection")
                 key = coll["key"]
-                output.append(f"- **{name}** (Key: {key})")
+                write(f"- **{name}** (Key: {key})\n")
         else:
-            # Display hierarchical structure
-            for key in sorted(top_level_keys):
-                output.extend(format_collection(key))
+            # Display hierarchical structure with an explicit stack; children
+            # are pushed in reverse so pop order matches the sorted lists
+            stack = [(key, 0) for key in reversed(top_level_keys)]
+            while stack:
+                key, level = stack.pop()
+                coll = collection_map.get(key)
+                if coll is None:
+                    continue
+                name = coll["data"].get("name", "Unnamed Collection")
+                write(f"{'  ' * level}- **{name}** (Key: {key})\n")
+                for child_key in reversed(hierarchy.get(key, [])):
+                    stack.append((child_key, level + 1))
 
-        return "\n".join(output)
+        return buf.getvalue().rstrip("\n")
 
     except Exception as e:
         ctx.error(f"Error fetching collections: {str(e)}")
@@ -828,6 +1075,7 @@ def get_collections(
     name="zotero_get_collection_items",
     description="Get all items in a specific Zotero collection."
 )
+@_coerce_int_args("limit")
 def get_collection_items(
     collection_key: str,
     limit: int | str | None = 50,
@@ -856,38 +1104,20 @@ def get_collection_items(
         except Exception:
             collection_name = f"Collection {collection_key}"
 
-        if isinstance(limit, str):
-            limit = int(limit)
-
         # Then get the items
         items = zot.collection_items(collection_key, limit=limit)
         if not items:
             return f"No items found in collection: {collection_name} (Key: {collection_key})"
 
         # Format items as markdown
-        output = [f"# Items in Collection: {collection_name}", ""]
+        buf = io.StringIO()
+        write = buf.write
+        write(f"# Items in Collection: {collection_name}\n\n")
 
         for i, item in enumerate(items, 1):
-            data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
+            _format_item_block(i, item, write, details=False)
 
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
-
-            # Build the formatted entry
-            output.append(f"## {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Authors:** {creators_str}")
-
-            output.append("")  # Empty line between items
-
-        return "\n".join(output)
+        return buf.getvalue().rstrip("\n")
 
     except Exception as e:
         ctx.error(f"Error fetching collection items: {str(e)}")
@@ -974,9 +1204,9 @@ def get_item_children(
                 key = note.get("key", "")
                 note_text = data.get("note", "")
 
-                # Clean up HTML in notes
-                note_text = note_text.replace("<p>", "").replace("</p>", "\n\n")
-                note_text = note_text.replace("<br/>", "\n").replace("<br>", "\n")
+                # Clean up HTML in notes; only the first slice can survive
+                # the 500-char display cap, so don't clean the full body
+                note_text = _clean_note_html(note_text[:2000])
 
                 # Limit note length for display
                 if len(note_text) > 500:
@@ -1012,6 +1242,7 @@ def get_item_children(
     name="zotero_get_tags",
     description="Get all tags used in your Zotero library."
 )
+@_coerce_int_args("limit")
 def get_tags(
     limit: int | str | None = None,
     *,
@@ -1031,31 +1262,28 @@ def get_tags(
         ctx.info("Fetching tags")
         zot = get_zotero_client(operation="read")
 
-        if isinstance(limit, str):
-            limit = int(limit)
-
         tags = zot.tags(limit=limit)
         if not tags:
             return "No tags found in your Zotero library."
 
-        # Format tags as markdown
-        output = ["# Zotero Tags", ""]
+        # Format tags as markdown; stream into one buffer since libraries
+        # can have thousands of tags
+        buf = io.StringIO()
+        write = buf.write
+        write("# Zotero Tags\n\n")
 
-        # Sort tags alphabetically
+        # Sort, then group by first letter; groupby runs the letter-change
+        # state machine in C instead of per-iteration Python bookkeeping
         sorted_tags = sorted(tags)
 
-        # Group tags alphabetically
-        current_letter = None
-        for tag in sorted_tags:
-            first_letter = tag[0].upper() if tag else "#"
-
-            if first_letter != current_letter:
-                current_letter = first_letter
-                output.append(f"## {current_letter}")
+        for letter, group in itertools.groupby(
+            sorted_tags, key=lambda t: t[0].upper() if t else "#"
+        ):
+            write(f"## {letter}\n")
+            for tag in group:
+                write(f"- `{tag}`\n")
 
-            output.append(f"- `{tag}`")
-
-        return "\n".join(output)
+        return buf.getvalue().rstrip("\n")
 
     except Exception as e:
         ctx.error(f"Error fetching tags: {str(e)}")
@@ -1100,31 +1328,21 @@ def get_recent(
             return "No items found in your Zotero library."
 
         # Format items as markdown
-        output = [f"# {limit} Most Recently Added Items", ""]
+        buf = io.StringIO()
+        write = buf.write
+        write(f"# {limit} Most Recently Added Items\n\n")
 
         for i, item in enumerate(items, 1):
-            data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
-            date_added = data.get("dateAdded", "Unknown")
+            get = item.get("data", {}).get
+            write(f"## {i}. {get('title', 'Untitled')}\n")
+            write(f"**Type:** {get('itemType', 'unknown')}\n")
+            write(f"**Item Key:** {item.get('key', '')}\n")
+            write(f"**Date:** {get('date', 'No date')}\n")
+            write(f"**Added:** {get('dateAdded', 'Unknown')}\n")
+            write(f"**Authors:** {format_creators(get('creators', []))}\n")
+            write("\n")  # Empty line between items
 
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
-
-            # Build the formatted entry
-            output.append(f"## {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Added:** {date_added}")
-            output.append(f"**Authors:** {creators_str}")
-
-            output.append("")  # Empty line between items
-
-        return "\n".join(output)
+        return buf.getvalue().rstrip("\n")
 
     except Exception as e:
         ctx.error(f"Error fetching recent items: {str(e)}")
@@ -1170,7 +1388,6 @@ def batch_update_tags(
         # Handle case where add_tags might be a JSON string instead of list
         if add_tags and isinstance(add_tags, str):
             try:
-                import json
                 add_tags = json.loads(add_tags)
                 ctx.info(f"Parsed add_tags from JSON string: {add_tags}")
             except json.JSONDecodeError:
@@ -1179,7 +1396,6 @@ def batch_update_tags(
         # Handle case where remove_tags might be a JSON string instead of list
         if remove_tags and isinstance(remove_tags, str):
             try:
-                import json
                 remove_tags = json.loads(remove_tags)
                 ctx.info(f"Parsed remove_tags from JSON string: {remove_tags}")
             except json.JSONDecodeError:
@@ -1191,26 +1407,30 @@ def batch_update_tags(
         if isinstance(limit, str):
             limit = int(limit)
 
-        # Search for items matching the query
-        zot.add_parameters(q=query, limit=limit)
+        # Search for items matching the query; exclude attachments
+        # server-side so they are never transferred or parsed
+        zot.add_parameters(q=query, limit=limit, itemType="-attachment")
         items = zot.items()
 
         if not items:
             return f"No items found matching query: '{query}'"
 
-        # Initialize counters
+        # Initialize counters; seeded with zeros so tags that never match
+        # still show up in the summary
         updated_count = 0
         skipped_count = 0
-        added_tag_counts = {tag: 0 for tag in (add_tags or [])}
-        removed_tag_counts = {tag: 0 for tag in (remove_tags or [])}
+        added_tag_counts = Counter(dict.fromkeys(add_tags or [], 0))
+        removed_tag_counts = Counter(dict.fromkeys(remove_tags or [], 0))
 
-        # Process each item
-        for item in items:
-            # Skip attachments if they were included in the results
-            if item["data"].get("itemType") == "attachment":
-                skipped_count += 1
-                continue
+        # Set views computed once; per item the tag diff is two set ops
+        # instead of nested membership loops
+        add_set = frozenset(t for t in (add_tags or []) if t)
+        remove_set = frozenset(remove_tags or [])
 
+        # Phase 1: diff each item locally and collect the ones needing a
+        # write; the network round-trips are issued in parallel afterwards
+        pending: list[dict] = []
+        for item in items:
             item_key = item.get("key") or item["data"].get("key")
             if not item_key:
                 ctx.warn("Skipping item without key in batch tag update.")
@@ -1228,82 +1448,81 @@ def batch_update_tags(
                     skipped_count += 1
                     continue
 
-            # Get current tags
+            # Diff current tags against the requested changes
             current_tags = item["data"].get("tags", [])
+            current_tag_values = {t["tag"] for t in current_tags}
+            to_remove = current_tag_values & remove_set
+            to_add = add_set - current_tag_values
+            needs_update = bool(to_remove or to_add)
 
-            # Track if this item needs to be updated
-            needs_update = False
-
-            # Process tags to remove
-            if remove_tags:
-                new_tags = []
-                for tag_obj in current_tags:
-                    tag = tag_obj["tag"]
-                    if tag in remove_tags:
-                        removed_tag_counts[tag] += 1
-                        needs_update = True
-                    else:
-                        new_tags.append(tag_obj)
-                current_tags = new_tags
-
-            # Process tags to add
-            if add_tags:
-                current_tag_values = {t["tag"] for t in current_tags}
-                for tag in add_tags:
-                    if tag and tag not in current_tag_values:
-                        current_tags.append({"tag": tag})
-                        added_tag_counts[tag] += 1
-                        needs_update = True
-
-            # Update the item if needed
-            # Since we are logging errors we might as well log the update.
             if needs_update:
-                try:
-                    item["data"]["tags"] = current_tags
-                    ctx.info(f"Updating item {item.get('key', 'unknown')} with tags: {current_tags}")
-                    result = zot.update_item(item)
-                    ctx.info(f"Update result: {result}")
-                    update_ok = True
-                    if isinstance(result, dict):
-                        if result.get("failed"):
-                            update_ok = False
-                        elif "success" in result or "successful" in result or "unchanged" in result:
-                            update_ok = bool(result.get("success") or result.get("successful") or result.get("unchanged"))
-                        elif result.get("error"):
-                            update_ok = False
-                    elif isinstance(result, bool):
-                        update_ok = result
-
-                    if update_ok:
-                        updated_count += 1
-                    else:
-                        skipped_count += 1
-                        ctx.error(f"Update reported failure for item {item_key}: {result}")
-                except Exception as e:
-                    ctx.error(f"Failed to update item {item.get('key', 'unknown')}: {str(e)}")
-                    # Continue with other items instead of failing completely
-                    skipped_count += 1
+                removed_tag_counts.update(to_remove)
+                added_tag_counts.update(to_add)
+                current_tags = [
+                    t for t in current_tags if t["tag"] not in to_remove
+                ] + [{"tag": t} for t in to_add]
+
+            if needs_update:
+                item["data"]["tags"] = current_tags
+                pending.append(item)
             else:
                 skipped_count += 1
 
+        # Phase 2: issue the writes concurrently; each update_item call is
+        # an independent network round-trip
+        if pending:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {
+                    executor.submit(zot.update_item, item): item
+                    for item in pending
+                }
+                for future in as_completed(futures):
+                    item = futures[future]
+                    item_key = item.get("key") or item["data"].get("key")
+                    try:
+                        result = future.result()
+                        ctx.info(f"Update result for {item_key}: {result}")
+                        update_ok = True
+                        if isinstance(result, dict):
+                            if result.get("failed"):
+                                update_ok = False
+                            elif "success" in result or "successful" in result or "unchanged" in result:
+                                update_ok = bool(result.get("success") or result.get("successful") or result.get("unchanged"))
+                            elif result.get("error"):
+                                update_ok = False
+                        elif isinstance(result, bool):
+                            update_ok = result
+
+                        if update_ok:
+                            updated_count += 1
+                        else:
+                            skipped_count += 1
+                            ctx.error(f"Update reported failure for item {item_key}: {result}")
+                    except Exception as e:
+                        ctx.error(f"Failed to update item {item_key}: {str(e)}")
+                        # Continue with other items instead of failing completely
+                        skipped_count += 1
+
         # Format the response
-        response = ["# Batch Tag Update Results", ""]
-        response.append(f"Query: '{query}'")
-        response.append(f"Items processed: {len(items)}")
-        response.append(f"Items updated: {updated_count}")
-        response.append(f"Items skipped: {skipped_count}")
+        buf = io.StringIO()
+        write = buf.write
+        write("# Batch Tag Update Results\n\n")
+        write(f"Query: '{query}'\n")
+        write(f"Items processed: {len(items)}\n")
+        write(f"Items updated: {updated_count}\n")
+        write(f"Items skipped: {skipped_count}")
 
         if add_tags:
-            response.append("\n## Tags Added")
-            for tag, count in added_tag_counts.items():
-                response.append(f"- `{tag}`: {count} items")
+            write("\n\n## Tags Added")
+            for tag, count in added_tag_counts.most_common():
+                write(f"\n- `{tag}`: {count} items")
 
         if remove_tags:
-            response.append("\n## Tags Removed")
-            for tag, count in removed_tag_counts.items():
-                response.append(f"- `{tag}`: {count} items")
+            write("\n\n## Tags Removed")
+            for tag, count in removed_tag_counts.most_common():
+                write(f"\n- `{tag}`: {count} items")
 
-        return "\n".join(response)
+        return buf.getvalue()
 
     except Exception as e:
         ctx.error(f"Error in batch tag update: {str(e)}")
@@ -1350,8 +1569,9 @@ def create_items(
         if not items_list:
             return "Error: items list is empty."
 
-        missing_types = [i for i, item in enumerate(items_list, 1) if "itemType" not in item]
-        if missing_types:
+        # Only build the full index listing on the error path
+        if not all("itemType" in item for item in items_list):
+            missing_types = [i for i, item in enumerate(items_list, 1) if "itemType" not in item]
             return f"Error: itemType missing for item(s): {', '.join(map(str, missing_types))}"
 
         ctx.info(f"Creating {len(items_list)} item(s)")
@@ -1386,6 +1606,12 @@ def create_items(
         return f"Error creating items: {str(e)}"
 
 
+# Item versions observed on successful writes. A follow-up update can
+# then PATCH straight away instead of refetching the whole item just to
+# learn its version; a stale entry surfaces as a 412 and is retried.
+_item_version_cache: dict[str, int] = {}
+
+
 @mcp.tool(
     name="zotero_update_item",
     description="Update a Zotero item by key using PATCH semantics."
@@ -1422,21 +1648,51 @@ def update_item(
         ctx.info(f"Updating item {item_key} (full_replace={full_replace})")
         zot = get_zotero_client(operation="write")
 
-        item = zot.item(item_key)
-        if not item:
-            return f"Error: No item found with key: {item_key}"
-
-        if full_replace:
-            payload = updates
-        else:
-            payload = item.get("data", {}).copy()
-            payload.update(updates)
-
+        # PATCH semantics only need the changed fields plus a version, so
+        # skip the full item refetch when we already know the version
+        payload = dict(updates)
         payload["key"] = item_key
+        used_cached_version = False
+
         if "version" not in payload:
+            cached_version = _item_version_cache.get(item_key)
+            if cached_version is not None:
+                payload["version"] = cached_version
+                used_cached_version = True
+            else:
+                item = zot.item(item_key)
+                if not item:
+                    return f"Error: No item found with key: {item_key}"
+                if not full_replace:
+                    payload = {**item.get("data", {}), **updates, "key": item_key}
+                payload["version"] = item.get("data", {}).get("version") or item.get("version")
+
+        try:
+            result = zot.update_item(payload)
+        except Exception as e:
+            err_text = str(e)
+            is_conflict = "412" in err_text or "Precondition Failed" in err_text
+            if not (used_cached_version and is_conflict):
+                raise
+            # Cached version was stale: refetch and retry once
+            _item_version_cache.pop(item_key, None)
+            item = zot.item(item_key)
+            if not item:
+                return f"Error: No item found with key: {item_key}"
+            if full_replace:
+                payload = dict(updates)
+                payload["key"] = item_key
+            else:
+                payload = {**item.get("data", {}), **updates, "key": item_key}
             payload["version"] = item.get("data", {}).get("version") or item.get("version")
+            result = zot.update_item(payload)
 
-        result = zot.update_item(payload)
+        new_version = zot.request.headers.get("last-modified-version")
+        if new_version:
+            try:
+                _item_version_cache[item_key] = int(new_version)
+            except (TypeError, ValueError):
+                pass
         return f"Update result: {result}"
     except Exception as e:
         ctx.error(f"Error updating item: {str(e)}")
@@ -1481,6 +1737,16 @@ def update_items(
         return f"Error batch updating items: {str(e)}"
 
 
+# Cached library version for batched deletes. The probe request exists
+# only to read the last-modified-version header. Always probe fresh: any
+# write tool bumps the version, so a cached value can send a stale
+# If-Unmodified-Since-Version and fail the delete with a 412.
+def _get_library_version(zot) -> str | None:
+    """Return the library's current last-modified version."""
+    zot.items(limit=1)
+    return zot.request.headers.get("last-modified-version")
+
+
 @mcp.tool(
     name="zotero_delete_item",
     description="Delete a Zotero item by key."
@@ -1547,8 +1813,7 @@ def delete_items(
 
         ctx.info(f"Deleting {len(item_keys)} items")
         zot = get_zotero_client(operation="write")
-        zot.items(limit=1)
-        library_version = zot.request.headers.get("last-modified-version")
+        library_version = _get_library_version(zot)
         payload = [{"key": key} for key in item_keys]
         result = zot.delete_item(payload, last_modified=library_version)
         return f"Delete result: {result}"
@@ -1708,8 +1973,7 @@ def delete_collections(
 
         ctx.info(f"Deleting {len(collection_keys)} collections")
         zot = get_zotero_client(operation="write")
-        zot.collections(limit=1)
-        library_version = zot.request.headers.get("last-modified-version")
+        library_version = _get_library_version(zot)
         payload = [{"key": key} for key in collection_keys]
         result = zot.delete_collection(payload, last_modified=library_version)
         return f"Delete result: {result}"
@@ -1884,18 +2148,18 @@ def normalize_tags(
             limit = int(limit)
 
         ctx.info(f"Normalizing tags for items matching '{query}' (dry_run={dry_run})")
+        tag_mapping = _fuse_tag_mapping(tag_mapping, case_mode)
         zot = get_zotero_client(operation="write")
-        zot.add_parameters(q=query, itemType="-attachment", limit=limit)
-        items = zot.items()
-
-        if not items:
-            return f"No items found matching query: '{query}'"
 
+        processed_count = 0
         updated_count = 0
         skipped_count = 0
         changed_tags_total = 0
+        pending = []
 
-        for item in items:
+        # Stream pages rather than materializing the full result list
+        for item in _iter_items(zot, limit, q=query, itemType="-attachment"):
+            processed_count += 1
             if item["data"].get("itemType") == "attachment":
                 skipped_count += 1
                 continue
@@ -1922,17 +2186,32 @@ def normalize_tags(
                 updated_count += 1
                 continue
 
-            try:
-                item["data"]["tags"] = normalized
-                zot.update_item(item)
-                updated_count += 1
-            except Exception as e:
-                ctx.error(f"Failed to update tags for item {item.get('key', 'unknown')}: {str(e)}")
-                skipped_count += 1
+            item["data"]["tags"] = normalized
+            pending.append(item)
+
+        if processed_count == 0:
+            return f"No items found matching query: '{query}'"
+
+        # Issue the writes concurrently; each update_item call is an
+        # independent network round-trip
+        if pending:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {
+                    executor.submit(zot.update_item, item): item
+                    for item in pending
+                }
+                for future in as_completed(futures):
+                    item = futures[future]
+                    try:
+                        future.result()
+                        updated_count += 1
+                    except Exception as e:
+                        ctx.error(f"Failed to update tags for item {item.get('key', 'unknown')}: {str(e)}")
+                        skipped_count += 1
 
         output = ["# Tag Normalization Results", ""]
         output.append(f"Query: '{query}'")
-        output.append(f"Items processed: {len(items)}")
+        output.append(f"Items processed: {processed_count}")
         output.append(f"Items changed: {updated_count}")
         output.append(f"Items skipped: {skipped_count}")
         output.append(f"Tag sets modified: {changed_tags_total}")
@@ -1989,6 +2268,7 @@ def plan_tag_normalization(
             limit = int(limit)
 
         ctx.info(f"Planning tag normalization for '{query}'")
+        fused_mapping = _fuse_tag_mapping(tag_mapping, case_mode)
         zot = get_zotero_client(operation="read")
         zot.add_parameters(q=query, itemType="-attachment", limit=limit)
         items = zot.items()
@@ -2005,7 +2285,7 @@ def plan_tag_normalization(
 
             normalized, changed = _normalize_tag_list(
                 tags=tags,
-                tag_mapping=tag_mapping,
+                tag_mapping=fused_mapping,
                 case_mode=case_mode,
                 trim_whitespace=trim_whitespace
             )
@@ -2101,7 +2381,7 @@ def apply_tag_normalization(
             _write_job(job_id, job)
             return f"No remaining items for job {job_id}. Status: completed."
 
-        tag_mapping = job.get("tag_mapping") or {}
+        tag_mapping = _fuse_tag_mapping(job.get("tag_mapping") or {}, job.get("case_mode", "none"))
         case_mode = job.get("case_mode", "none")
         trim_whitespace = bool(job.get("trim_whitespace", True))
 
@@ -2286,53 +2566,82 @@ def batch_update_items(
             return f"Error creating saved search: {saved_search.get('failed', 'Unknown error')}"
 
         search_key = next(iter(saved_search.get("success", {}).values()), None)
+
+        matched_count = 0
+        updated_count = 0
+        skipped_count = 0
+        unchanged_count = 0
+        pending = []
+
+        # Stream pages while the temporary saved search still exists
         try:
-            zot.add_parameters(searchKey=search_key, limit=limit)
-            results = zot.items()
+            for item in _iter_items(zot, limit, searchKey=search_key):
+                matched_count += 1
+
+                if item["data"].get("itemType") == "attachment":
+                    skipped_count += 1
+                    continue
+
+                # Skip the write round-trip when every update is already
+                # in place on the item
+                data = item["data"]
+                if all(data.get(k) == v for k, v in updates.items()):
+                    unchanged_count += 1
+                    continue
+
+                if not dry_run:
+                    pending.append(item)
         finally:
             try:
                 zot.delete_saved_search([search_key])
             except Exception as cleanup_error:
                 ctx.warn(f"Error cleaning up saved search: {str(cleanup_error)}")
 
-        if not results:
+        if matched_count == 0:
             return "No items found matching the search criteria."
 
-        updated_count = 0
-        skipped_count = 0
-
-        for item in results:
-            if item["data"].get("itemType") == "attachment":
-                skipped_count += 1
-                continue
-
-            if dry_run:
-                updated_count += 1
-                continue
+        # Dry runs apply no per-item work beyond the attachment filter, so
+        # the count is just arithmetic on the totals
+        if dry_run:
+            updated_count = matched_count - skipped_count - unchanged_count
 
+        def _update_one(item: dict) -> None:
+            item["data"].update(updates)
             try:
-                item["data"].update(updates)
                 zot.update_item(item)
-                updated_count += 1
             except Exception as e:
                 err_text = str(e)
                 item_key = item.get("key") or item["data"].get("key")
                 # Retry once on version conflicts by refreshing the item
                 if item_key and ("412" in err_text or "Precondition Failed" in err_text):
+                    fresh_item = zot.item(item_key)
+                    fresh_item["data"].update(updates)
+                    zot.update_item(fresh_item)
+                    return
+                raise
+
+        # Issue the writes concurrently; each update_item call is an
+        # independent network round-trip
+        if pending:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {
+                    executor.submit(_update_one, item): item
+                    for item in pending
+                }
+                for future in as_completed(futures):
+                    item = futures[future]
+                    item_key = item.get("key") or item["data"].get("key")
                     try:
-                        fresh_item = zot.item(item_key)
-                        fresh_item["data"].update(updates)
-                        zot.update_item(fresh_item)
+                        future.result()
                         updated_count += 1
-                        continue
-                    except Exception as retry_error:
-                        ctx.error(f"Retry failed for item {item_key}: {str(retry_error)}")
-                ctx.error(f"Failed to update item {item_key or 'unknown'}: {err_text}")
-                skipped_count += 1
+                    except Exception as e:
+                        ctx.error(f"Failed to update item {item_key or 'unknown'}: {str(e)}")
+                        skipped_count += 1
 
         output = ["# Batch Item Update Results", ""]
-        output.append(f"Matched items: {len(results)}")
+        output.append(f"Matched items: {matched_count}")
         output.append(f"Items updated: {updated_count}")
+        output.append(f"Items unchanged: {unchanged_count}")
         output.append(f"Items skipped: {skipped_count}")
         output.append(f"Dry run: {dry_run}")
         return "\n".join(output)
@@ -2383,15 +2692,17 @@ def collect_items(
 
         updated_count = 0
         skipped_count = 0
+        unchanged_count = 0
 
         for item in items:
             if item["data"].get("itemType") == "attachment":
                 skipped_count += 1
                 continue
 
+            # Already in the target collection; no write needed
             collections = item["data"].get("collections", [])
             if collection_key in collections:
-                skipped_count += 1
+                unchanged_count += 1
                 continue
 
             if dry_run:
@@ -2411,6 +2722,7 @@ def collect_items(
         output.append(f"Query: '{query}'")
         output.append(f"Items processed: {len(items)}")
         output.append(f"Items updated: {updated_count}")
+        output.append(f"Items unchanged: {unchanged_count}")
         output.append(f"Items skipped: {skipped_count}")
         output.append(f"Dry run: {dry_run}")
         return "\n".join(output)
@@ -2470,7 +2782,6 @@ def advanced_search(
             return "Error: No search conditions provided"
 
         ctx.info(f"Performing advanced search with {len(conditions)} conditions")
-        zot = get_zotero_client(operation="write")
 
         # Prepare search parameters
         params = {}
@@ -2496,96 +2807,155 @@ def advanced_search(
         except Exception as e:
             return f"Error: {e}"
 
-        # Add join mode condition
-        search_conditions.append({
-            "condition": "joinMode",
-            "operator": join_mode,
-            "value": ""
-        })
-
-        # Create a saved search
-        search_name = f"temp_search_{uuid.uuid4().hex[:8]}"
-        saved_search = zot.saved_search(
-            search_name,
-            search_conditions
-        )
+        # Simple ANDed conditions run as one direct read instead of the
+        # create/query/delete saved-search sequence
+        direct_params = _direct_search_params(search_conditions, join_mode)
+        if direct_params is not None:
+            ctx.info("Conditions map to direct query parameters; skipping saved search")
+            zot = get_zotero_client(operation="read")
+            zot.add_parameters(**direct_params, **params)
+            results = zot.items()
+        else:
+            zot = get_zotero_client(operation="write")
+
+            # Add join mode condition
+            search_conditions.append({
+                "condition": "joinMode",
+                "operator": join_mode,
+                "value": ""
+            })
+
+            # Create a saved search
+            search_name = f"temp_search_{uuid.uuid4().hex[:8]}"
+            saved_search = zot.saved_search(
+                search_name,
+                search_conditions
+            )
 
-        # Extract the search key from the result
-        if not saved_search.get("success"):
-            return f"Error creating saved search: {saved_search.get('failed', 'Unknown error')}"
+            # Extract the search key from the result
+            if not saved_search.get("success"):
+                return f"Error creating saved search: {saved_search.get('failed', 'Unknown error')}"
 
-        search_key = next(iter(saved_search.get("success", {}).values()), None)
+            search_key = next(iter(saved_search.get("success", {}).values()), None)
 
-        # Execute the saved search
-        try:
-            zot.add_parameters(searchKey=search_key, **params)
-            results = zot.items()
-        finally:
-            # Clean up the temporary saved search
+            # Execute the saved search
             try:
-                zot.delete_saved_search([search_key])
-            except Exception as cleanup_error:
-                ctx.warn(f"Error cleaning up saved search: {str(cleanup_error)}")
+                zot.add_parameters(searchKey=search_key, **params)
+                results = zot.items()
+            finally:
+                # Clean up the temporary saved search
+                try:
+                    zot.delete_saved_search([search_key])
+                except Exception as cleanup_error:
+                    ctx.warn(f"Error cleaning up saved search: {str(cleanup_error)}")
 
         # Format the results
         if not results:
             return "No items found matching the search criteria."
 
-        output = ["# Advanced Search Results", ""]
-        output.append(f"Found {len(results)} items matching the search criteria:")
-        output.append("")
+        buf = io.StringIO()
+        write = buf.write
+        write("# Advanced Search Results\n\n")
+        write(f"Found {len(results)} items matching the search criteria:\n\n")
 
         # Add search criteria summary
-        output.append("## Search Criteria")
-        output.append(f"Join mode: {join_mode.upper()}")
+        write("## Search Criteria\n")
+        write(f"Join mode: {join_mode.upper()}\n")
 
         for i, condition in enumerate(conditions, 1):
-            output.append(f"{i}. {condition['field']} {condition['operation']} \"{condition['value']}\"")
+            write(f"{i}. {condition['field']} {condition['operation']} \"{condition['value']}\"\n")
 
-        output.append("")
-
-        # Format results
-        output.append("## Results")
+        write("\n## Results\n")
 
         for i, item in enumerate(results, 1):
             data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
-
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
+            get = data.get
 
             # Build the formatted entry
-            output.append(f"### {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Authors:** {creators_str}")
+            write(f"### {i}. {get('title', 'Untitled')}\n")
+            write(f"**Type:** {get('itemType', 'unknown')}\n")
+            write(f"**Item Key:** {item.get('key', '')}\n")
+            write(f"**Date:** {get('date', 'No date')}\n")
+            write(f"**Authors:** {format_creators(get('creators', []))}\n")
 
             # Add abstract snippet if present
-            if abstract := data.get("abstractNote"):
+            if abstract := get("abstractNote"):
                 # Limit abstract length for search results
-                abstract_snippet = abstract[:150] + "..." if len(abstract) > 150 else abstract
-                output.append(f"**Abstract:** {abstract_snippet}")
+                write(f"**Abstract:** {_snippet(abstract, 150)}\n")
 
             # Add tags if present
-            if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
+            if tags := get("tags"):
+                tag_list = " ".join(f"`{tag['tag']}`" for tag in tags)
+                write(f"**Tags:** {tag_list}\n")
 
-            output.append("")  # Empty line between items
+            write("\n")  # Empty line between items
 
-        return "\n".join(output)
+        return buf.getvalue().rstrip("\n")
 
     except Exception as e:
         ctx.error(f"Error in advanced search: {str(e)}")
         return f"Error in advanced search: {str(e)}"
 
 
+def _parent_titles(zot, parent_keys) -> dict[str, str]:
+    """Fetch titles for the given parent item keys in batched requests.
+
+    One itemKey-filtered request per 50 keys replaces the per-annotation
+    zot.item round-trips in the rendering loops. Keys that cannot be
+    resolved are simply absent from the returned mapping.
+    """
+    titles: dict[str, str] = {}
+    keys = [k for k in dict.fromkeys(parent_keys) if k]
+    for start in range(0, len(keys), 50):
+        chunk = keys[start:start + 50]
+        try:
+            for parent in zot.items(itemKey=",".join(chunk)):
+                titles[parent.get("key", "")] = parent.get("data", {}).get("title", "Untitled")
+        except Exception:
+            continue
+    return titles
+
+
+# Successful resolutions only: a None result usually means Better BibTeX
+# was unreachable or a search transiently failed, and caching it would
+# pin the item to "no citation key" for the process lifetime.
+_CITEKEY_CACHE_MAX = 1024
+_citekey_cache: dict[tuple[str, str, str], str] = {}
+
+
+def _resolve_citekey(item_key: str, extra: str, title: str) -> str | None:
+    """Resolve an item's Better BibTeX citation key.
+
+    Checks the Extra field first, then falls back to a Better BibTeX title
+    search. Successful lookups are cached so repeated annotation requests
+    for the same item skip the parsing and the network round-trip;
+    failures are retried on the next call.
+    """
+    cache_key = (item_key, extra, title)
+    if (cached := _citekey_cache.get(cache_key)) is not None:
+        return cached
+
+    citekey: str | None = None
+    if extra and (m := _CITATION_KEY_RE.search(extra)):
+        citekey = m.group(1).strip()
+    elif title:
+        try:
+            bibtex = _bbt_client_if_running()
+            if bibtex is not None:
+                for result in bibtex.search_citekeys(title):
+                    if result.get("citekey"):
+                        citekey = result["citekey"]
+                        break
+        except Exception:
+            citekey = None
+
+    if citekey:
+        if len(_citekey_cache) >= _CITEKEY_CACHE_MAX:
+            _citekey_cache.pop(next(iter(_citekey_cache)))
+        _citekey_cache[cache_key] = citekey
+    return citekey
+
+
 @mcp.tool(
     name="zotero_get_annotations",
     description="Get all annotations for a specific item or across your entire Zotero library."
@@ -2633,54 +3003,19 @@ def get_annotations(
             pdf_annotations = []
 
             # Try Better BibTeX method (local Zotero only)
-            if os.environ.get("ZOTERO_LOCAL", "").lower() in ["true", "yes", "1"]:
+            if is_local_mode():
                 try:
-                    # Import Better BibTeX dependencies
-                    from zotero_mcp.better_bibtex_client import (
-                        ZoteroBetterBibTexAPI,
-                        process_annotation,
-                        get_color_category
-                    )
-
-                    # Initialize Better BibTeX client
-                    bibtex = ZoteroBetterBibTexAPI()
-
-                    # Check if Zotero with Better BibTeX is running
-                    if bibtex.is_zotero_running():
-                        # Extract citation key
-                        citation_key = None
-
-                        # Try to find citation key in Extra field
-                        try:
-                            extra_field = parent["data"].get("extra", "")
-                            for line in extra_field.split("\n"):
-                                if line.lower().startswith("citation key:"):
-                                    citation_key = line.replace("Citation Key:", "").strip()
-                                    break
-                                elif line.lower().startswith("citationkey:"):
-                                    citation_key = line.replace("citationkey:", "").strip()
-                                    break
-                        except Exception as e:
-                            ctx.warn(f"Error extracting citation key from Extra field: {e}")
-
-                        # Fallback to searching by title if no citation key found
-                        if not citation_key:
-                            title = parent["data"].get("title", "")
-                            try:
-                                if title:
-                                    # Use the search_citekeys method
-                                    search_results = bibtex.search_citekeys(title)
-
-                                    # Find the matching item
-                                    for result in search_results:
-                                        ctx.info(f"Checking result: {result}")
-
-                                        # Try to match with item key if possible
-                                        if result.get('citekey'):
-                                            citation_key = result['citekey']
-                                            break
-                            except Exception as e:
-                                ctx.warn(f"Error searching for citation key: {e}")
+                    # Shared client + cached availability probe from
+                    # client.py, so all modules agree on reachability
+                    bibtex = _bbt_client_if_running()
+                    if bibtex is not None:
+                        # Extract citation key (Extra field, then title
+                        # search; cached across calls for the same item)
+                        citation_key = _resolve_citekey(
+                            item_key,
+                            parent["data"].get("extra", ""),
+                            parent["data"].get("title", ""),
+                        )
 
                         # Process annotations if citation key found
                         if citation_key:
@@ -2700,6 +3035,10 @@ def get_annotations(
                                 for attachment in attachments:
                                     annotations = bibtex.get_annotations_from_attachment(attachment)
 
+                                    # Hoisted per attachment; tolerates both
+                                    # flat BibTeX dicts and data-nested items
+                                    att_title = attachment.get("data", attachment).get("title", "")
+
                                     for anno in annotations:
                                         processed = process_annotation(anno, attachment)
                                         if processed:
@@ -2716,7 +3055,7 @@ def get_annotations(
                                                     "tags": [],
                                                     "_pdf_page": processed.get("page", 0),
                                                     "_pageLabel": processed.get("pageLabel", ""),
-                                                    "_attachment_title": attachment.get("title", ""),
+                                                    "_attachment_title": att_title,
                                                     "_color_category": get_color_category(processed.get("color", "")),
                                                     "_from_better_bibtex": True
                                                 }
@@ -2745,10 +3084,6 @@ def get_annotations(
             # PDF Extraction fallback
             if use_pdf_extraction and not (better_bibtex_annotations or zotero_api_annotations):
                 try:
-                    from zotero_mcp.pdfannots_helper import extract_annotations_from_pdf, ensure_pdfannots_installed
-                    import tempfile
-                    import uuid
-
                     # Ensure PDF annotation tool is installed
                     if ensure_pdfannots_installed():
                         # Get PDF attachments
@@ -2758,43 +3093,23 @@ def get_annotations(
                             if item.get("data", {}).get("contentType") == "application/pdf"
                         ]
 
-                        # Extract annotations from PDFs
-                        for attachment in pdf_attachments:
-                            with tempfile.TemporaryDirectory() as tmpdir:
-                                att_key = attachment.get("key", "")
-                                file_path = os.path.join(tmpdir, f"{att_key}.pdf")
-                                zot.dump(att_key, file_path)
-
-                                if os.path.exists(file_path):
-                                    extracted = extract_annotations_from_pdf(file_path, tmpdir)
-
-                                    for ext in extracted:
-                                        # Skip empty annotations
-                                        if not ext.get("annotatedText") and not ext.get("comment"):
-                                            continue
-
-                                        # Create Zotero-like annotation object
-                                        pdf_anno = {
-                                            "key": f"pdf_{att_key}_{ext.get('id', uuid.uuid4().hex[:8])}",
-                                            "data": {
-                                                "itemType": "annotation",
-                                                "annotationType": ext.get("type", "highlight"),
-                                                "annotationText": ext.get("annotatedText", ""),
-                                                "annotationComment": ext.get("comment", ""),
-                                                "annotationColor": ext.get("color", ""),
-                                                "parentItem": item_key,
-                                                "tags": [],
-                                                "_pdf_page": ext.get("page", 0),
-                                                "_from_pdf_extraction": True,
-                                                "_attachment_title": attachment.get("data", {}).get("title", "PDF")
-                                            }
-                                        }
-
-                                        # Handle image annotations
-                                        if ext.get("type") == "image" and ext.get("imageRelativePath"):
-                                            pdf_anno["data"]["_image_path"] = os.path.join(tmpdir, ext.get("imageRelativePath"))
-
-                                        pdf_annotations.append(pdf_anno)
+                        # Extract annotations from the PDFs concurrently:
+                        # each worker downloads and parses one attachment
+                        if pdf_attachments:
+                            with ThreadPoolExecutor(
+                                max_workers=min(8, len(pdf_attachments))
+                            ) as executor:
+                                futures = [
+                                    executor.submit(
+                                        _extract_one_pdf, zot, attachment, item_key
+                                    )
+                                    for attachment in pdf_attachments
+                                ]
+                                for future in as_completed(futures):
+                                    try:
+                                        pdf_annotations.extend(future.result())
+                                    except Exception as e:
+                                        ctx.warn(f"Error extracting PDF annotations: {e}")
 
                         ctx.info(f"Retrieved {len(pdf_annotations)} annotations via PDF extraction")
                 except Exception as pdf_error:
@@ -2804,50 +3119,61 @@ def get_annotations(
             annotations = better_bibtex_annotations + zotero_api_annotations + pdf_annotations
 
         else:
-            # Retrieve all annotations in the library
+            # Retrieve library-wide annotations page by page, stopping at
+            # the limit instead of buffering the whole set like everything()
             if isinstance(limit, str):
                 limit = int(limit)
-            zot.add_parameters(itemType="annotation", limit=limit or 50)
-            annotations = zot.everything(zot.items())
+            max_results = limit or 50
+            zot.add_parameters(itemType="annotation", limit=min(100, max_results))
+            annotations = []
+            for page in zot.makeiter(zot.items()):
+                annotations.extend(page)
+                if len(annotations) >= max_results:
+                    del annotations[max_results:]
+                    break
 
         # Handle no annotations found
         if not annotations:
             return f"No annotations found{f' for item: {parent_title}' if item_key else ''}."
 
+        # Batch-fetch parent titles for library-wide retrieval
+        parent_titles = {} if item_key else _parent_titles(
+            zot, (a.get("data", {}).get("parentItem") for a in annotations)
+        )
+
         # Generate markdown output
         output = [f"# Annotations{f' for: {parent_title}' if item_key else ''}", ""]
 
         for i, anno in enumerate(annotations, 1):
             data = anno.get("data", {})
+            g = data.get
 
-            # Annotation details
-            anno_type = data.get("annotationType", "Unknown type")
-            anno_text = data.get("annotationText", "")
-            anno_comment = data.get("annotationComment", "")
-            anno_color = data.get("annotationColor", "")
+            # Annotation details, bound once per iteration
+            anno_type = g("annotationType", "Unknown type")
+            anno_text = g("annotationText", "")
+            anno_comment = g("annotationComment", "")
+            anno_color = g("annotationColor", "")
             anno_key = anno.get("key", "")
 
             # Parent item context for library-wide retrieval
             parent_info = ""
-            if not item_key and (parent_key := data.get("parentItem")):
-                try:
-                    parent = zot.item(parent_key)
-                    parent_title = parent["data"].get("title", "Untitled")
-                    parent_info = f" (from \"{parent_title}\")"
-                except Exception:
+            if not item_key and (parent_key := g("parentItem")):
+                if parent_key in parent_titles:
+                    parent_info = f" (from \"{parent_titles[parent_key]}\")"
+                else:
                     parent_info = f" (parent key: {parent_key})"
 
             # Annotation source details
             source_info = ""
-            if data.get("_from_better_bibtex", False):
+            if g("_from_better_bibtex", False):
                 source_info = " (extracted via Better BibTeX)"
-            elif data.get("_from_pdf_extraction", False):
+            elif g("_from_pdf_extraction", False):
                 source_info = " (extracted directly from PDF)"
 
             # Attachment context
             attachment_info = ""
-            if "_attachment_title" in data and data["_attachment_title"]:
-                attachment_info = f" in {data['_attachment_title']}"
+            if attachment_title := g("_attachment_title"):
+                attachment_info = f" in {attachment_title}"
 
             # Build markdown annotation entry
             output.append(f"## Annotation {i}{parent_info}{attachment_info}{source_info}")
@@ -2857,13 +3183,13 @@ def get_annotations(
             # Color information
             if anno_color:
                 output.append(f"**Color:** {anno_color}")
-                if "_color_category" in data and data["_color_category"]:
-                    output.append(f"**Color Category:** {data['_color_category']}")
+                if color_category := g("_color_category"):
+                    output.append(f"**Color Category:** {color_category}")
 
             # Page information
-            if "_pdf_page" in data:
-                label = data.get("_pageLabel", str(data["_pdf_page"]))
-                output.append(f"**Page:** {data['_pdf_page']} (Label: {label})")
+            if (pdf_page := g("_pdf_page")) is not None:
+                label = g("_pageLabel", str(pdf_page))
+                output.append(f"**Page:** {pdf_page} (Label: {label})")
 
             # Annotation content
             if anno_text:
@@ -2872,15 +3198,14 @@ def get_annotations(
             if anno_comment:
                 output.append(f"**Comment:** {anno_comment}")
 
-            # Image annotation
-            if "_image_path" in data and os.path.exists(data["_image_path"]):
+            # Image annotation (flag precomputed at extraction time; no
+            # stat() per annotation here)
+            if g("_image_exists"):
                 output.append("**Image:** This annotation includes an image (not displayed in this interface)")
 
             # Tags
-            if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
+            if tags := g("tags"):
+                output.append("**Tags:** " + " ".join(f"`{tag['tag']}`" for tag in tags))
 
             output.append("")  # Empty line between annotations
 
@@ -2930,6 +3255,11 @@ def get_notes(
         if not notes:
             return f"No notes found{f' for item {item_key}' if item_key else ''}."
 
+        # Batch-fetch parent titles up front
+        parent_titles = _parent_titles(
+            zot, (n.get("data", {}).get("parentItem") for n in notes)
+        )
+
         # Generate markdown output
         output = [f"# Notes{f' for Item: {item_key}' if item_key else ''}", ""]
 
@@ -2940,19 +3270,17 @@ def get_notes(
             # Parent item context
             parent_info = ""
             if parent_key := data.get("parentItem"):
-                try:
-                    parent = zot.item(parent_key)
-                    parent_title = parent["data"].get("title", "Untitled")
-                    parent_info = f" (from \"{parent_title}\")"
-                except Exception:
+                if parent_key in parent_titles:
+                    parent_info = f" (from \"{parent_titles[parent_key]}\")"
+                else:
                     parent_info = f" (parent key: {parent_key})"
 
             # Prepare note text
             note_text = data.get("note", "")
 
-            # Clean up HTML formatting
-            note_text = note_text.replace("<p>", "").replace("</p>", "\n\n")
-            note_text = note_text.replace("<br/>", "\n").replace("<br>", "\n")
+            # Clean up HTML formatting; only the first slice can survive
+            # the 500-char display cap, so don't clean the full body
+            note_text = _clean_note_html(note_text[:2000])
 
             # Limit note length for display
             if len(note_text) > 500:
@@ -2964,9 +3292,7 @@ def get_notes(
 
             # Tags
             if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
+                output.append("**Tags:** " + " ".join(f"`{tag['tag']}`" for tag in tags))
 
             output.append(f"**Content:**\n{note_text}")
             output.append("")  # Empty line between notes
@@ -3023,36 +3349,31 @@ def search_notes(
             ctx=ctx
         )
 
-        # Parse the annotation results to extract annotation items
-        # This is a bit hacky and depends on the exact formatting of get_annotations
-        # You might want to modify get_annotations to return a more structured result
-        annotation_lines = annotation_results.split("\n")
-        current_annotation = None
-        annotations = []
+        # One case-insensitive matcher shared by the annotation and note
+        # filters; searching the raw text avoids a lowercase copy per block
+        query_pat = re.compile(re.escape(query), re.IGNORECASE)
 
-        for line in annotation_lines:
-            if line.startswith("## "):
-                if current_annotation:
-                    annotations.append(current_annotation)
-                current_annotation = {"lines": [line], "type": "annotation"}
-            elif current_annotation is not None:
-                current_annotation["lines"].append(line)
-
-        if current_annotation:
-            annotations.append(current_annotation)
+        # Parse the annotation results to extract annotation items.
+        # This is a bit hacky and depends on the exact formatting of
+        # get_annotations, but one C-level split beats walking every line.
+        annotations = [
+            {"type": "annotation", "lines": ("## " + block).split("\n")}
+            for block in annotation_results.split("\n## ")[1:]
+            if query_pat.search(block)
+        ]
 
         # Format results
         output = [f"# Search Results for '{query}'", ""]
 
         # Filter and highlight notes
         query_lower = query.lower()
+        qlen = len(query)
         note_results = []
 
         for note in notes:
             data = note.get("data", {})
-            note_text = data.get("note", "").lower()
 
-            if query_lower in note_text:
+            if query_pat.search(data.get("note", "")):
                 # Prepare full note details
                 note_result = {
                     "type": "note",
@@ -3064,6 +3385,11 @@ def search_notes(
         # Combine and sort results
         all_results = note_results + annotations
 
+        # Batch-fetch parent titles for the note results up front
+        parent_titles = _parent_titles(
+            zot, (r["data"].get("parentItem") for r in note_results)
+        )
+
         for i, result in enumerate(all_results, 1):
             if result["type"] == "note":
                 # Note formatting
@@ -3073,48 +3399,35 @@ def search_notes(
                 # Parent item context
                 parent_info = ""
                 if parent_key := data.get("parentItem"):
-                    try:
-                        parent = zot.item(parent_key)
-                        parent_title = parent["data"].get("title", "Untitled")
-                        parent_info = f" (from \"{parent_title}\")"
-                    except Exception:
+                    if parent_key in parent_titles:
+                        parent_info = f" (from \"{parent_titles[parent_key]}\")"
+                    else:
                         parent_info = f" (parent key: {parent_key})"
 
                 # Note text with query highlight
-                note_text = data.get("note", "")
-                note_text = note_text.replace("<p>", "").replace("</p>", "\n\n")
-                note_text = note_text.replace("<br/>", "\n").replace("<br>", "\n")
-
-                # Highlight query in note text
-                try:
-                    # Find first occurrence of query and extract context
-                    text_lower = note_text.lower()
-                    pos = text_lower.find(query_lower)
-                    if pos >= 0:
-                        # Extract context around the query
-                        start = max(0, pos - 100)
-                        end = min(len(note_text), pos + 200)
-                        context = note_text[start:end]
-
-                        # Highlight the query in the context
-                        highlighted = context.replace(
-                            context[context.lower().find(query_lower):context.lower().find(query_lower)+len(query)],
-                            f"**{context[context.lower().find(query_lower):context.lower().find(query_lower)+len(query)]}**"
-                        )
-
-                        note_text = highlighted + "..."
-                except Exception:
-                    # Fallback to first 500 characters if highlighting fails
-                    note_text = note_text[:500] + "..."
+                note_text = _clean_note_html(data.get("note", ""))
+
+                # Highlight the first occurrence of the query; find()
+                # returns -1 rather than raising, so a plain guard suffices
+                pos = note_text.lower().find(query_lower)
+                if pos >= 0:
+                    # Extract context around the query and bold the match
+                    # by splicing around the single found offset
+                    start = max(0, pos - 100)
+                    end = min(len(note_text), pos + 200)
+                    p = pos - start
+                    q_end = p + qlen
+                    context = note_text[start:end]
+                    note_text = (
+                        f"{context[:p]}**{context[p:q_end]}**{context[q_end:]}..."
+                    )
 
                 output.append(f"## Note {i}{parent_info}")
                 output.append(f"**Key:** {key}")
 
                 # Tags
                 if tags := data.get("tags"):
-                    tag_list = [f"`{tag['tag']}`" for tag in tags]
-                    if tag_list:
-                        output.append(f"**Tags:** {' '.join(tag_list)}")
+                    output.append("**Tags:** " + " ".join(f"`{tag['tag']}`" for tag in tags))
 
                 output.append(f"**Content:**\n{note_text}")
                 output.append("")
@@ -3179,14 +3492,12 @@ def create_note(
         if "<p>" in note_text or "<div>" in note_text:
             html_content = note_text
         else:
-            # Convert plain text to HTML paragraphs - avoiding f-strings with replacements
-            paragraphs = note_text.split("\n\n")
-            html_parts = []
-            for p in paragraphs:
-                # Replace newlines with <br/> tags
-                p_with_br = p.replace("\n", "<br/>")
-                html_parts.append("<p>" + p_with_br + "</p>")
-            html_content = "".join(html_parts)
+            # Convert plain text to HTML paragraphs; escape in one
+            # C-level pass so literal &/< in the text survive round-trips
+            html_content = "".join(
+                f"<p>{p.replace(chr(10), '<br/>')}</p>"
+                for p in html.escape(note_text, quote=False).split("\n\n")
+            )
 
         # Prepare the note data
         note_data = {
@@ -3321,14 +3632,11 @@ if _semantic_tools_enabled():
 
                     # Add abstract snippet if present
                     if abstract := data.get("abstractNote"):
-                        abstract_snippet = abstract[:200] + "..." if len(abstract) > 200 else abstract
-                        output.append(f"**Abstract:** {abstract_snippet}")
+                        output.append(f"**Abstract:** {_snippet(abstract)}")
 
                     # Add tags if present
                     if tags := data.get("tags"):
-                        tag_list = [f"`{tag['tag']}`" for tag in tags]
-                        if tag_list:
-                            output.append(f"**Tags:** {' '.join(tag_list)}")
+                        output.append("**Tags:** " + " ".join(f"`{tag['tag']}`" for tag in tags))
 
                     # Show matched text snippet
                     matched_text = result.get("matched_text", "")
@@ -3581,7 +3889,7 @@ def chatgpt_connector_search(
     name="fetch",
     description="ChatGPT-compatible fetch wrapper. Retrieves fulltext/metadata for a Zotero item by ID."
 )
-def connector_fetch(
+async def connector_fetch(
     id: str,
     *,
     ctx: Context
@@ -3604,7 +3912,7 @@ def connector_fetch(
         # Fetch item metadata for title and context
         zot = get_zotero_client(operation="fulltext")
         try:
-            item = zot.item(item_key)
+            item = await asyncio.to_thread(zot.item, item_key)
             data = item.get("data", {}) if item else {}
         except Exception:
             item = None
@@ -3621,7 +3929,7 @@ def connector_fetch(
         url = web_url or zotero_url
 
         # Use existing tool to get best-effort fulltext/markdown
-        text_md = get_item_fulltext.fn(item_key=item_key, ctx=ctx)
+        text_md = await get_item_fulltext.fn(item_key=item_key, ctx=ctx)
         # Extract the actual full text section if present, else keep as-is
         text_clean = text_md
         try:
@@ -1,6 +1,20 @@
-from typing import List, Dict
+import functools
 import os
 
+
+@functools.lru_cache(maxsize=4096)
+def _format_creators_cached(key: tuple) -> str:
+    """Format a hashable creators snapshot; cached because author lists
+    repeat heavily across items in the formatting loops."""
+    names = []
+    for first, last, name in key:
+        if first is not None and last is not None:
+            names.append(f"{last}, {first}")
+        elif name is not None:
+            names.append(name)
+    return "; ".join(names) if names else "No authors listed"
+
+
 def format_creators(creators: list[dict[str, str]]) -> str:
     """
     Format creator names into a string.
@@ -11,20 +25,31 @@ def format_creators(creators: list[dict[str, str]]) -> str:
     Returns:
         Formatted string with creator names.
     """
-    names = []
-    for creator in creators:
-        if "firstName" in creator and "lastName" in creator:
-            names.append(f"{creator['lastName']}, {creator['firstName']}")
-        elif "name" in creator:
-            names.append(creator["name"])
-    return "; ".join(names) if names else "No authors listed"
+    key = tuple(
+        (c.get("firstName"), c.get("lastName"), c.get("name")) for c in creators
+    )
+    return _format_creators_cached(key)
+
+
+_local_mode: bool | None = None
 
 
 def is_local_mode() -> bool:
     """Return True if running in local mode.
 
     Local mode is enabled when environment variable `ZOTERO_LOCAL` is set to a
-    truthy value ("true", "yes", or "1", case-insensitive).
+    truthy value ("true", "yes", or "1", case-insensitive). The parsed flag is
+    cached after the first call; use `refresh_local_flag` if the environment
+    changes at runtime.
     """
-    value = os.getenv("ZOTERO_LOCAL", "")
-    return value.lower() in {"true", "yes", "1"}
+    global _local_mode
+    if _local_mode is None:
+        value = os.getenv("ZOTERO_LOCAL", "")
+        _local_mode = value.lower() in {"true", "yes", "1"}
+    return _local_mode
+
+
+def refresh_local_flag() -> None:
+    """Re-read `ZOTERO_LOCAL` on the next `is_local_mode` call."""
+    global _local_mode
+    _local_mode = None